@@ -1,9 +1,11 @@
 import logging
 import re
+from datetime import datetime
 from decimal import Decimal
+from operator import itemgetter
 from pathlib import Path
 from sqlite3 import register_adapter
-from typing import Dict, Union, get_args, get_origin
+from typing import Callable, Dict, Union, get_args, get_origin
 
 import pendulum
 import pymysql.converters
@@ -19,6 +21,7 @@ from sqlalchemy import (
     Engine,
     ForeignKey,
     Index,
+    Insert,
     Integer,
     LargeBinary,
     MetaData,
@@ -27,12 +30,17 @@ from sqlalchemy import (
     String,
     Table,
     Text,
+    bindparam,
     create_engine,
+    literal,
+    select,
 )
 from sqlalchemy import Date as SQLDate
 from sqlalchemy import DateTime as SQLDateTime
 from sqlalchemy.dialects import mssql
 from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.engine import Engine
 
 from src.settings import DevConfig, config, get_database_config
@@ -188,7 +196,7 @@ def _get_timezone_aware_datetime_type():
     return SQLDateTime(timezone=True)
 
 
-def _get_json_column_type(engine: Engine):
+def _get_json_column_type():
     drivername = config.DRIVERNAME
 
     json_column_mapping = {
@@ -202,19 +210,19 @@ def _get_json_column_type(engine: Engine):
         if dialect_key == drivername:
             return column_type
 
-    logger.warning(
-        f"Unknown database dialect '{drivername}', defaulting to JSON: {engine.url}"
-    )
+    logger.warning(f"Unknown database dialect '{drivername}', defaulting to JSON")
     return JSON
 
 
-def format_datetime_for_db(dt: pendulum.DateTime) -> str:
+def format_datetime_for_db(dt: datetime) -> str:
     """Format datetime for database insert, accounting for database-specific requirements.
 
     MySQL: 'YYYY-MM-DD HH:MM:SS.microseconds' (no timezone, space instead of T)
     PostgreSQL/SQL Server/SQLite: ISO 8601 with timezone
     """
     drivername = config.DRIVERNAME
+    # Callers stamp plain datetimes; format them exactly as before
+    dt = pendulum.instance(dt)
 
     if drivername == "mysql":
         # MySQL DATETIME doesn't support timezone, format as 'YYYY-MM-DD HH:MM:SS.microseconds'
@@ -224,6 +232,12 @@ def format_datetime_for_db(dt: pendulum.DateTime) -> str:
         return dt.to_iso8601_string()
 
 
+# Dialects whose merge statement reports its own insert and update counts
+MERGE_COUNTING_DRIVERS = frozenset({"postgresql", "mssql"})
+# Dialects with INSERT ... ON CONFLICT ... RETURNING, needed by direct_upsert sources
+DIRECT_UPSERT_DRIVERS = frozenset({"postgresql", "sqlite"})
+
+
 def create_merge_sql(
     stage_table_name: str,
     target_table_name: str,
@@ -231,11 +245,17 @@ def create_merge_sql(
     columns: list[str],
     update_columns: list[str],
     grain: list[str],
-    now_iso: str,
 ) -> str:
+    """Build the stage-to-target upsert for the configured dialect.
+
+    The ETL timestamp is the `:etl_now` bind parameter so the SQL text is stable
+    across files and can be cached by the caller and the server's plan cache.
+    On the MERGE_COUNTING_DRIVERS the statement also returns one row with
+    target_inserts and target_updates, so no separate count queries are needed.
+    """
     drivername = config.DRIVERNAME
     insert_columns = ", ".join(columns) + ", etl_created_at"
-    select_columns = ", ".join([f"stage.{col}" for col in columns]) + f", '{now_iso}'"
+    select_columns = ", ".join([f"stage.{col}" for col in columns]) + ", :etl_now"
 
     # Exclude source_filename from regular updates - it will be conditionally updated
     update_columns_filtered = [
@@ -252,7 +272,7 @@ def create_merge_sql(
             f"source_filename = IF(stage.etl_row_hash != {target_table_name}.etl_row_hash, stage.source_filename, {target_table_name}.source_filename)"
         )
         update_on_duplicate_parts.append(
-            f"etl_updated_at = IF(stage.etl_row_hash != {target_table_name}.etl_row_hash, '{now_iso}', {target_table_name}.etl_updated_at)"
+            f"etl_updated_at = IF(stage.etl_row_hash != {target_table_name}.etl_row_hash, :etl_now, {target_table_name}.etl_updated_at)"
         )
         update_on_duplicate = ", ".join(update_on_duplicate_parts)
 
@@ -288,17 +308,50 @@ def create_merge_sql(
             DO UPDATE SET
                 {update_set}
         """
+    elif drivername == "postgresql":
+        # PostgreSQL uses INSERT ... ON CONFLICT so RETURNING can report what happened;
+        # xmax is 0 only for freshly inserted rows
+        conflict_columns = ", ".join(grain)
+        update_set = ", ".join(
+            [f"{col} = excluded.{col}" for col in update_columns_filtered]
+        )
+        update_set += ", source_filename = excluded.source_filename"
+        update_set += ", etl_updated_at = CAST(:etl_now AS TIMESTAMPTZ)"
+        select_columns = (
+            ", ".join([f"stage.{col}" for col in columns])
+            + ", CAST(:etl_now AS TIMESTAMPTZ)"
+        )
+
+        merge_sql = f"""
+            WITH merged AS (
+                INSERT INTO {target_table_name} AS target ({insert_columns})
+                SELECT {select_columns}
+                FROM {stage_table_name} AS stage
+                ON CONFLICT ({conflict_columns})
+                DO UPDATE SET {update_set}
+                WHERE target.etl_row_hash != excluded.etl_row_hash
+                RETURNING (xmax = 0) AS inserted
+            )
+            SELECT
+                COUNT(*) FILTER (WHERE inserted) AS target_inserts,
+                COUNT(*) FILTER (WHERE NOT inserted) AS target_updates
+            FROM merged
+        """
     else:
-        # PostgreSQL and SQL Server use MERGE INTO
+        # SQL Server uses MERGE INTO, collecting $action to count inserts and updates.
+        # NOCOUNT keeps the counts SELECT as the first result set; it is session-wide,
+        # so it is switched back off for the pooled connection's later rowcount reads
         update_set = ", ".join(
             [f"{col} = stage.{col}" for col in update_columns_filtered]
         )
         update_set += f", source_filename = stage.source_filename"
-        update_set += f", etl_updated_at = '{now_iso}'"
+        update_set += ", etl_updated_at = :etl_now"
         insert_values = ", ".join([f"stage.{col}" for col in columns])
-        insert_values += f", '{now_iso}'"
+        insert_values += ", :etl_now"
 
         merge_sql = f"""
+            SET NOCOUNT ON;
+            DECLARE @merge_actions TABLE (merge_action NVARCHAR(10));
             MERGE INTO {target_table_name} AS target
             USING {stage_table_name} AS stage
             ON {join_condition}
@@ -306,40 +359,39 @@ def create_merge_sql(
                 UPDATE SET {update_set}
             WHEN NOT MATCHED THEN
                 INSERT ({insert_columns})
-                VALUES ({insert_values});
+                VALUES ({insert_values})
+            OUTPUT $action INTO @merge_actions;
+            SELECT
+                COALESCE(SUM(CASE WHEN merge_action = 'INSERT' THEN 1 ELSE 0 END), 0) AS target_inserts,
+                COALESCE(SUM(CASE WHEN merge_action = 'UPDATE' THEN 1 ELSE 0 END), 0) AS target_updates
+            FROM @merge_actions;
+            SET NOCOUNT OFF;
         """
 
     return merge_sql
 
 
-def calculate_batch_size(source: DataSource) -> int:
-    """Calculate batch size based on database-specific requirements."""
-    drivername = config.DRIVERNAME
-
-    if drivername == "mssql" and not config.SQL_SERVER_SQLBULKCOPY_FLAG:
-        # SQL Server has two limits:
-        # 1. Max 1000 rows per INSERT statement
-        # 2. Max 2100 values per INSERT statement
-        # We need to respect both limits and maximize batch size
-        column_count = (
-            len(source.source_model.model_fields) + 2
-        )  # +2 for ETL metadata columns (etl_row_hash, source_filename)
-
-        # Calculate max rows based on value limit: (2100 / columns_per_row) - 1 for safety margin
-        max_rows_from_values = (2100 // column_count) - 1
+POSTGRES_COPY_BATCH_SIZE = 50000
 
-        # SQL Server hard limit: 1000 rows per INSERT
-        max_rows_from_records = 1000
 
-        # Take the minimum of both limits (config.BATCH_SIZE is typically 10K+ so not a factor)
-        max_rows = min(max_rows_from_values, max_rows_from_records)
-        return max(1, max_rows)
+def calculate_batch_size(source: DataSource) -> int:
+    """Calculate batch size based on database-specific requirements.
 
-    # For other databases, use configured batch size
+    Batches are sent with executemany (pyodbc fast_executemany on SQL Server), so
+    SQL Server's 1000 rows / 2100 parameters per statement limits no longer apply.
+    PostgreSQL stage loads stream through COPY, where larger batches just mean
+    fewer round trips, so it defaults higher unless BATCH_SIZE is set explicitly.
+    """
+    if (
+        config.DRIVERNAME == "postgresql"
+        and "BATCH_SIZE" not in config.model_fields_set
+    ):
+        return POSTGRES_COPY_BATCH_SIZE
     return config.BATCH_SIZE
 
 
-def create_tables() -> Engine:
+def create_db_engine() -> Engine:
+    """Create the engine for the configured database without running any DDL."""
     # Register Pendulum adapters before creating engine
     _register_pendulum_adapters()
 
@@ -355,102 +407,144 @@ def create_tables() -> Engine:
         engine_kwargs["max_overflow"] = db_config["sqlalchemy.max_overflow"]
     if "sqlalchemy.pool_timeout" in db_config:
         engine_kwargs["pool_timeout"] = db_config["sqlalchemy.pool_timeout"]
+    if "sqlalchemy.fast_executemany" in db_config:
+        engine_kwargs["fast_executemany"] = db_config["sqlalchemy.fast_executemany"]
+
+    return create_engine(**engine_kwargs)
+
+
+# The log table's columns are known up front, so it is declared once at import
+# instead of being reflected by every FileProcessor
+_log_metadata = MetaData()
+# SQLite requires Integer for auto-increment primary keys
+_log_id_column_type = Integer if config.DRIVERNAME == "sqlite" else BigInteger
+_log_datetime_type = _get_timezone_aware_datetime_type()
+
+file_load_log = Table(
+    "file_load_log",
+    _log_metadata,
+    Column("id", _log_id_column_type, primary_key=True, autoincrement=True),
+    Column("source_filename", String(255), nullable=False),
+    Column("started_at", _log_datetime_type, nullable=False),
+    Column("duplicate_skipped", Boolean, nullable=True),
+    # archive copy phase
+    Column("archive_copy_started_at", _log_datetime_type, nullable=True),
+    Column("archive_copy_ended_at", _log_datetime_type, nullable=True),
+    Column("archive_copy_success", Boolean, nullable=True),
+    # processing phase
+    Column("processing_started_at", _log_datetime_type, nullable=True),
+    Column("processing_ended_at", _log_datetime_type, nullable=True),
+    Column("processing_success", Boolean, nullable=True),
+    # stage load phase
+    Column("stage_load_started_at", _log_datetime_type, nullable=True),
+    Column("stage_load_ended_at", _log_datetime_type, nullable=True),
+    Column("stage_load_success", Boolean, nullable=True),
+    # audit phase
+    Column("audit_started_at", _log_datetime_type, nullable=True),
+    Column("audit_ended_at", _log_datetime_type, nullable=True),
+    Column("audit_success", Boolean, nullable=True),
+    # merge phase
+    Column("merge_started_at", _log_datetime_type, nullable=True),
+    Column("merge_ended_at", _log_datetime_type, nullable=True),
+    Column("merge_success", Boolean, nullable=True),
+    # summary
+    Column("ended_at", _log_datetime_type, nullable=True),
+    Column("records_processed", Integer, nullable=True),
+    Column("validation_errors", Integer, nullable=True),
+    Column("records_stage_loaded", Integer, nullable=True),
+    Column("target_inserts", Integer, nullable=True),
+    Column("target_updates", Integer, nullable=True),
+    Column("success", Boolean, nullable=True),
+    Column("error_type", String(50), nullable=True),
+)
+Index(
+    "idx_file_load_log_source_filename",
+    file_load_log.c.source_filename,
+    file_load_log.c.id,
+)
 
-    engine = create_engine(**engine_kwargs)
+# Dead Letter Queue table for validation failures
+# Use appropriate JSON column type based on database backend
+_dlq_json_column_type = _get_json_column_type()
+
+file_load_dlq = Table(
+    "file_load_dlq",
+    _log_metadata,
+    Column("id", _log_id_column_type, primary_key=True, autoincrement=True),
+    Column("source_filename", String(255), nullable=False),
+    Column("file_row_number", Integer, nullable=False),
+    Column("file_record_data", _dlq_json_column_type, nullable=False),
+    Column("validation_errors", _dlq_json_column_type, nullable=False),
+    Column(
+        "file_load_log_id",
+        _log_id_column_type,
+        ForeignKey(file_load_log.c.id),
+        nullable=False,
+    ),
+    Column("target_table_name", String(255), nullable=False),
+    Column("failed_at", _log_datetime_type, nullable=False),
+)
+Index("idx_dlq_file_load_log_id", file_load_dlq.c.file_load_log_id)
+Index("idx_dlq_source_filename", file_load_dlq.c.source_filename, file_load_dlq.c.id)
+
+
+def create_target_table(source: DataSource, metadata: MetaData) -> Table:
+    """Declare the target table for a source, keyed on its grain."""
+    columns = get_table_columns(source, include_timestamps=True)
+    return Table(
+        source.table_name,
+        metadata,
+        *columns,
+        PrimaryKeyConstraint(*source.grain),
+    )
+
+
+def create_upsert_statement(
+    target_table: Table, source: DataSource, etl_now: datetime
+) -> Insert:
+    """Build the batch upsert used by `direct_upsert` sources.
+
+    Rows go straight into the target with INSERT ... ON CONFLICT (grain), updating
+    only rows whose hash changed, the same rule the stage MERGE applies. RETURNING
+    etl_updated_at tells the two apart: it is still NULL for inserted rows.
+    """
+    dialect_insert = (
+        postgresql_insert if config.DRIVERNAME == "postgresql" else sqlite_insert
+    )
+    stmt = dialect_insert(target_table).values(
+        etl_created_at=literal(etl_now, target_table.c.etl_created_at.type)
+    )
+    update_columns = [
+        col.name
+        for col in get_table_columns(source, include_timestamps=False)
+        if col.name not in source.grain
+    ]
+    set_ = {col: stmt.excluded[col] for col in update_columns}
+    set_["etl_updated_at"] = literal(etl_now, target_table.c.etl_updated_at.type)
+    return stmt.on_conflict_do_update(
+        index_elements=source.grain,
+        set_=set_,
+        where=target_table.c.etl_row_hash != stmt.excluded.etl_row_hash,
+    ).returning(target_table.c.etl_updated_at)
+
+
+def create_tables() -> Engine:
+    engine = create_db_engine()
 
     metadata = MetaData()
     tables = []
 
     for source in MASTER_REGISTRY.sources:
-        columns = get_table_columns(source, include_timestamps=True)
         if len(source.grain) > 3:
             logger.warning(
                 f"Source {source.table_name} has more than 3 grain columns. Inefficient primary key."
             )
-        primary_key = PrimaryKeyConstraint(*source.grain)
-        table = Table(
-            source.table_name,
-            metadata,
-            *columns,
-            primary_key,
-        )
+        table = create_target_table(source, metadata)
         # define index separately, bound to table column
         Index(f"idx_{source.table_name}_source_filename", table.c.source_filename)
         tables.append(table)
 
-    # SQLite requires Integer for auto-increment primary keys
-    id_column_type = Integer if config.DRIVERNAME == "sqlite" else BigInteger
-    datetime_type = _get_timezone_aware_datetime_type()
-
-    file_load_log = Table(
-        "file_load_log",
-        metadata,
-        Column("id", id_column_type, primary_key=True, autoincrement=True),
-        Column("source_filename", String(255), nullable=False),
-        Column("started_at", datetime_type, nullable=False),
-        Column("duplicate_skipped", Boolean, nullable=True),
-        # archive copy phase
-        Column("archive_copy_started_at", datetime_type, nullable=True),
-        Column("archive_copy_ended_at", datetime_type, nullable=True),
-        Column("archive_copy_success", Boolean, nullable=True),
-        # processing phase
-        Column("processing_started_at", datetime_type, nullable=True),
-        Column("processing_ended_at", datetime_type, nullable=True),
-        Column("processing_success", Boolean, nullable=True),
-        # stage load phase
-        Column("stage_load_started_at", datetime_type, nullable=True),
-        Column("stage_load_ended_at", datetime_type, nullable=True),
-        Column("stage_load_success", Boolean, nullable=True),
-        # audit phase
-        Column("audit_started_at", datetime_type, nullable=True),
-        Column("audit_ended_at", datetime_type, nullable=True),
-        Column("audit_success", Boolean, nullable=True),
-        # merge phase
-        Column("merge_started_at", datetime_type, nullable=True),
-        Column("merge_ended_at", datetime_type, nullable=True),
-        Column("merge_success", Boolean, nullable=True),
-        # summary
-        Column("ended_at", datetime_type, nullable=True),
-        Column("records_processed", Integer, nullable=True),
-        Column("validation_errors", Integer, nullable=True),
-        Column("records_stage_loaded", Integer, nullable=True),
-        Column("target_inserts", Integer, nullable=True),
-        Column("target_updates", Integer, nullable=True),
-        Column("success", Boolean, nullable=True),
-        Column("error_type", String(50), nullable=True),
-    )
-    Index(
-        "idx_file_load_log_source_filename",
-        file_load_log.c.source_filename,
-        file_load_log.c.id,
-    )
     tables.append(file_load_log)
-
-    # Dead Letter Queue table for validation failures
-    # Use appropriate JSON column type based on database backend
-    json_column_type = _get_json_column_type(engine)
-
-    file_load_dlq = Table(
-        "file_load_dlq",
-        metadata,
-        Column("id", id_column_type, primary_key=True, autoincrement=True),
-        Column("source_filename", String(255), nullable=False),
-        Column("file_row_number", Integer, nullable=False),
-        Column("file_record_data", json_column_type, nullable=False),
-        Column("validation_errors", json_column_type, nullable=False),
-        Column(
-            "file_load_log_id",
-            id_column_type,
-            ForeignKey("file_load_log.id"),
-            nullable=False,
-        ),
-        Column("target_table_name", String(255), nullable=False),
-        Column("failed_at", datetime_type, nullable=False),
-    )
-    Index("idx_dlq_file_load_log_id", file_load_dlq.c.file_load_log_id)
-    Index(
-        "idx_dlq_source_filename", file_load_dlq.c.source_filename, file_load_dlq.c.id
-    )
     tables.append(file_load_dlq)
     if isinstance(config, DevConfig):
         metadata.drop_all(engine, tables=tables)
@@ -484,34 +578,97 @@ def get_delete_dlq_sql() -> str:
     return delete_sql
 
 
-def create_row_hash(
-    record: Dict[str, str], sorted_keys: tuple[str, ...] | None = None
-) -> bytes:
-    string_items = {
-        key: str(value) if value is not None else "" for key, value in record.items()
-    }
+def create_row_hash(record: Dict[str, str], sorted_keys: tuple[str, ...]) -> bytes:
+    """Hash the record's values in a fixed column order with xxh3_128.
 
-    data_string = "|".join(
-        string_items.get(key, "") for key in sorted_keys if key in string_items
+    `sorted_keys` is computed once per file; keys missing from the record are
+    skipped and None values hash as "".
+    """
+    data_string = "\x1f".join(
+        "" if (value := record[key]) is None else str(value)
+        for key in sorted_keys
+        if key in record
     )
 
-    return xxhash.xxh32(data_string.encode("utf-8")).digest()
+    return xxhash.xxh3_128_digest(data_string.encode("utf-8"))
+
 
+def create_row_hasher(sorted_keys: tuple[str, ...]) -> Callable[[Dict], bytes]:
+    """Return a row hash function for validated records, bound to one column order.
 
-def sanitize_table_name(filename: str) -> str:
-    name = Path(filename).stem
-    # Replace invalid characters with underscore
-    name = re.sub(r"[^a-zA-Z0-9_]", "_", name)
-    # Ensure it starts with letter
-    if not name[0].isalpha():
-        name = f"t_{name}"
-    return name
+    Validated records always contain every model field, so the values are fetched
+    in a single itemgetter call and joined in one pass. Produces the same digest
+    as create_row_hash for a complete record.
+    """
+    if len(sorted_keys) == 1:
+        key = sorted_keys[0]
+
+        def get_values(record):
+            return (record[key],)
+    else:
+        get_values = itemgetter(*sorted_keys)
+    digest = xxhash.xxh3_128_digest
+
+    def row_hash(record: Dict) -> bytes:
+        return digest(
+            "\x1f".join(
+                ["" if value is None else str(value) for value in get_values(record)]
+            ).encode("utf-8")
+        )
+
+    return row_hash
 
 
-def create_stage_table(engine, source, source_filename: str, log: FileLoadLog) -> str:
-    sanitized_name = sanitize_table_name(source_filename)
-    stage_table_name = f"stage_{sanitized_name}"
+def rehash_target_table(engine: Engine, source: DataSource) -> int:
+    """Recompute etl_row_hash for every row of a source's target table.
+
+    One-off migration for when create_row_hash changes: stored hashes no longer
+    match, so every row touched by the next load would be counted as an update.
+    Rows are re-validated through the source model so the hashed values are the
+    same ones the loader produces. Only grain values and new hashes are held in
+    memory; returns the number of rows rehashed.
+    """
+    model = source.source_model
+    field_names = tuple(model.model_fields.keys())
+    sorted_keys = tuple(sorted(field_names))
+    table = Table(source.table_name, MetaData(), autoload_with=engine)
+
+    updates = []
+    with engine.connect() as connection:
+        rows = connection.execute(select(*[table.c[name] for name in field_names]))
+        for row in rows.mappings():
+            record = model.model_validate(dict(row)).model_dump()
+            params = {f"grain_{col}": row[col] for col in source.grain}
+            params["new_row_hash"] = create_row_hash(record, sorted_keys=sorted_keys)
+            updates.append(params)
+
+    update_stmt = (
+        table.update()
+        .where(*[table.c[col] == bindparam(f"grain_{col}") for col in source.grain])
+        .values(etl_row_hash=bindparam("new_row_hash"))
+    )
+    batch_size = calculate_batch_size(source)
+    with engine.begin() as connection:
+        for start in range(0, len(updates), batch_size):
+            connection.execute(update_stmt, updates[start : start + batch_size])
+
+    logger.info(f"Rehashed {len(updates):,} rows in {source.table_name}")
+    return len(updates)
 
+
+def rehash_target_tables() -> None:
+    """Run rehash_target_table for every registered source."""
+    engine = create_db_engine()
+    try:
+        for source in MASTER_REGISTRY.sources:
+            rehash_target_table(engine, source)
+    finally:
+        engine.dispose()
+
+
+def create_stage_table(
+    engine, source, stage_table_name: str, log: FileLoadLog
+) -> Table:
     metadata = MetaData()
     columns = get_table_columns(source, include_timestamps=False)
 
@@ -520,7 +677,16 @@ def create_stage_table(engine, source, source_filename: str, log: FileLoadLog) -
     metadata.create_all(engine, tables=[stage_table])
     logger.info(f"[log_id={log.id}] Created stage table: {stage_table_name}")
 
-    return stage_table_name
+    return stage_table
+
+
+def get_truncate_sql(table_name: str) -> str:
+    drivername = config.DRIVERNAME
+
+    if drivername == "sqlite":
+        # SQLite has no TRUNCATE; an unqualified DELETE uses its truncate optimization
+        return f"DELETE FROM {table_name}"
+    return f"TRUNCATE TABLE {table_name}"
 
 
 def create_grain_validation_sql(source: DataSource) -> str:
@@ -19,10 +19,15 @@ class ValidationThresholdExceededError(Exception):
 
 
 # File-specific errors that should not be retried and are handled via email notifications
-FILE_ERROR_EXCEPTIONS = {
-    MissingHeaderError,
-    MissingColumnsError,
-    ValidationThresholdExceededError,
-    AuditFailedError,
-    GrainValidationError,
-}
+FILE_ERROR_EXCEPTIONS = frozenset(
+    {
+        MissingHeaderError,
+        MissingColumnsError,
+        ValidationThresholdExceededError,
+        AuditFailedError,
+        GrainValidationError,
+    }
+)
+
+# Tuple form for isinstance checks and except clauses
+FILE_ERROR_EXCEPTION_TYPES = tuple(FILE_ERROR_EXCEPTIONS)
@@ -1,36 +1,69 @@
+import errno
+import itertools
 import json
 import logging
-import multiprocessing
+import os
+import queue
+import secrets
 import shutil
-from concurrent.futures import ThreadPoolExecutor
+import threading
+from concurrent.futures import (
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from datetime import UTC, datetime
+from multiprocessing import get_context
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, Iterator, List
+from time import monotonic_ns
+from typing import Any, Callable, Dict, Iterator, List
 
-import pendulum
 from opentelemetry import trace
-from pydantic import TypeAdapter, ValidationError
-from sqlalchemy import MetaData, Table, insert, select, text, update
+from pydantic import ValidationError
+from sqlalchemy import (
+    Connection,
+    Engine,
+    Insert,
+    MetaData,
+    Table,
+    TextClause,
+    insert,
+    select,
+    text,
+    update,
+)
 from sqlalchemy.orm import Session, sessionmaker
 
 from src.db import (
+    DIRECT_UPSERT_DRIVERS,
+    MERGE_COUNTING_DRIVERS,
     calculate_batch_size,
+    create_db_engine,
     create_duplicate_sql,
     create_grain_validation_sql,
     create_merge_sql,
-    create_row_hash,
+    create_row_hasher,
     create_stage_table,
     create_tables,
+    create_target_table,
+    create_upsert_statement,
+    file_load_dlq,
+    file_load_log,
     format_datetime_for_db,
     get_delete_dlq_sql,
     get_table_columns,
+    get_truncate_sql,
 )
 from src.exceptions import (
-    FILE_ERROR_EXCEPTIONS,
+    FILE_ERROR_EXCEPTION_TYPES,
     AuditFailedError,
     GrainValidationError,
     ValidationThresholdExceededError,
 )
-from src.notifications import send_failure_notification
+from src.notifications import flush_slack_notifications, send_failure_notification
 from src.readers.base_reader import BaseReader
 from src.readers.reader_factory import ReaderFactory
 from src.retry import get_error_location, retry
@@ -39,59 +72,130 @@ from src.sources.base import DataSource, FileLoadLog
 from src.sources.systems.master import MASTER_REGISTRY
 from src.sqlserver import bulk_insert
 from src.utils import (
+    FieldNameResolver,
     create_field_mapping,
     create_reverse_field_mapping,
     extract_failed_field_names,
     extract_validation_error_message,
+    fast_copy,
     get_field_alias,
 )
 
 logger = logging.getLogger(__name__)
 
 
+@retry()
+def _write_log_updates(engine: Engine, pending: list[tuple[int, dict[str, Any]]]):
+    with engine.begin() as conn:
+        for log_id, vals in pending:
+            conn.execute(
+                update(file_load_log).where(file_load_log.c.id == log_id).values(**vals)
+            )
+
+
+def _run_log_writer(
+    log_queue: queue.Queue,
+    engine: Engine,
+    failures: list[tuple[str, Exception]],
+) -> None:
+    """Drain queued log updates, writing whatever has piled up in one transaction.
+
+    Updates for a log row are applied in the order they were queued, so the last
+    snapshot wins. Writes that still fail after retries are added to failures for
+    the next flush to raise. A None item stops the writer. Kept outside
+    FileProcessor so the thread does not hold a reference that would stop __del__
+    from running.
+    """
+    while True:
+        pending = [log_queue.get()]
+        while True:
+            try:
+                pending.append(log_queue.get_nowait())
+            except queue.Empty:
+                break
+        updates = [entry for entry in pending if entry is not None]
+        try:
+            if updates:
+                _write_log_updates(engine, updates)
+        except Exception as e:
+            log_ids = ", ".join(str(log_id) for log_id, _ in updates)
+            logger.exception(f"Failed to write file load log updates ({log_ids}): {e}")
+            failures.append((log_ids, e))
+        finally:
+            for _ in pending:
+                log_queue.task_done()
+        if len(updates) != len(pending):
+            return
+
+
 class FileProcessor:
-    def __init__(self):
+    def __init__(self, create_schema: bool = True):
         self.reader_factory = ReaderFactory()
-        self.engine = create_tables()
+        # Worker processes share the parent's schema and must not rerun the DDL
+        self.engine = create_tables() if create_schema else create_db_engine()
         self.Session = sessionmaker[Session](bind=self.engine)
-        self.thread_pool = ThreadPoolExecutor(max_workers=multiprocessing.cpu_count())
-        self._metadata = MetaData()
-        # Pre-initialize table references at startup to avoid reflection queries during processing
-        self._metadata.reflect(
-            bind=self.engine, only=["file_load_log", "file_load_dlq"]
-        )
-        self._file_load_log = Table(
-            "file_load_log", self._metadata, autoload_with=self.engine
+        self.thread_pool = ThreadPoolExecutor(max_workers=config.IO_CONCURRENCY)
+        # Separate pool for archive copies: file workers wait on these, so sharing
+        # thread_pool could deadlock once every worker is waiting
+        self._archive_pool = ThreadPoolExecutor(max_workers=config.IO_CONCURRENCY)
+        self._merge_sql_cache: dict[tuple[str, str], tuple[TextClause, ...]] = {}
+        self._duplicate_check_cache: dict[str, TextClause] = {}
+        self._target_tables: dict[str, Table] = {}
+        self._insert_stmt_cache: dict[str, Insert] = {}
+        self._copy_stmt_cache: dict[str, tuple[str, tuple[str, ...]]] = {}
+        self._positional_insert_cache: dict[
+            str, tuple[str, tuple[str, ...], tuple[Callable | None, ...]]
+        ] = {}
+        # One stage table per (source table, worker thread), reused across files
+        self._stage_tables: dict[tuple[str, int], Table] = {}
+        self._stage_table_suffix = secrets.token_hex(4)
+        self._worker_local = threading.local()
+        self._worker_ids = itertools.count()
+        # Log row updates are written by one background thread, off the file workers
+        self._log_queue: queue.Queue[tuple[int, dict[str, Any]] | None] = queue.Queue()
+        self._log_write_failures: list[tuple[str, Exception]] = []
+        self._log_writer = threading.Thread(
+            target=_run_log_writer,
+            args=(self._log_queue, self.engine, self._log_write_failures),
+            name="file-load-log-writer",
+            daemon=True,
         )
-        self._file_load_dlq = Table(
-            "file_load_dlq", self._metadata, autoload_with=self.engine
-        )
-
-    def _get_file_load_log(self) -> Table:
-        return self._file_load_log
+        self._log_writer.start()
 
     def _get_file_load_dlq(self) -> Table:
-        return self._file_load_dlq
+        return file_load_dlq
 
     @retry()
     def _log_start(self, source_filename: str, started_at) -> int:
-        log = self._get_file_load_log()
-        stmt = insert(log).values(
+        stmt = insert(file_load_log).values(
             source_filename=source_filename, started_at=started_at
         )
         with self.engine.begin() as conn:
             res = conn.execute(stmt)
             return int(res.inserted_primary_key[0])
 
-    @retry()
     def _log_update(self, log: FileLoadLog) -> None:
-        log_table = self._get_file_load_log()
+        """Queue a snapshot of the log row for the background log writer."""
         vals = log.model_dump(
             exclude_unset=True, exclude={"id", "source_filename", "started_at"}
         )
-        stmt = update(log_table).where(log_table.c.id == log.id).values(**vals)
-        with self.engine.begin() as conn:
-            conn.execute(stmt)
+        self._log_queue.put((log.id, vals))
+
+    def _flush_log_updates(self) -> None:
+        """Block until every queued log update has been written.
+
+        Raises if any update could not be written, so a stale file_load_log row
+        does not go unnoticed.
+        """
+        if self._log_writer.is_alive():
+            self._log_queue.join()
+        if self._log_write_failures:
+            failures = self._log_write_failures.copy()
+            self._log_write_failures.clear()
+            log_ids = ", ".join(log_ids for log_ids, _ in failures)
+            raise RuntimeError(
+                f"Failed to write file load log updates for log_id(s): {log_ids}"
+            ) from failures[0][1]
 
     def _get_reader(self, file_path: Path) -> BaseReader:
         source = MASTER_REGISTRY.find_source_for_file(file_path.name)
@@ -106,20 +210,20 @@ class FileProcessor:
 
     @retry()
     def _check_duplicate_file(self, source: DataSource, source_filename: str) -> bool:
-        with self.Session() as session:
-            try:
-                check_sql = text(
-                    f"SELECT CASE WHEN EXISTS(SELECT 1 FROM {source.table_name} WHERE source_filename = :filename) THEN 1 ELSE 0 END"
-                )
-                result = session.execute(
-                    check_sql, {"filename": source_filename}
-                ).scalar()
-                return bool(result)
-            except Exception as e:
-                logger.warning(
-                    f"Error checking for duplicate file {source_filename} in {source.table_name}: {e}"
-                )
-                return False
+        """Return whether rows from this file already exist in the target table.
+
+        Errors propagate (after retries) rather than being read as "not a duplicate",
+        which would silently load the same file twice.
+        """
+        check_sql = self._duplicate_check_cache.get(source.table_name)
+        if check_sql is None:
+            check_sql = text(
+                f"SELECT CASE WHEN EXISTS(SELECT 1 FROM {source.table_name} WHERE source_filename = :filename) THEN 1 ELSE 0 END"
+            )
+            self._duplicate_check_cache[source.table_name] = check_sql
+        with self.engine.connect() as connection:
+            result = connection.execute(check_sql, {"filename": source_filename})
+            return bool(result.scalar())
 
     def _copy_to_archive(
         self, file_path: Path, archive_path: Path, log: FileLoadLog
@@ -127,9 +231,9 @@ class FileProcessor:
         """Copy file to archive directory with logging."""
         archive_file_path = archive_path / file_path.name
         try:
-            log.archive_copy_started_at = pendulum.now("UTC")
-            shutil.copyfile(file_path, archive_file_path)
-            log.archive_copy_ended_at = pendulum.now("UTC")
+            log.archive_copy_started_at = datetime.now(UTC)
+            fast_copy(file_path, archive_file_path)
+            log.archive_copy_ended_at = datetime.now(UTC)
             log.archive_copy_success = True
             logger.info(
                 f"[log_id={log.id}] Copied {file_path.name} to archive: {archive_file_path}"
@@ -148,58 +252,73 @@ class FileProcessor:
         destination = duplicates_path / file_path.name
 
         if destination.exists():
-            timestamp = pendulum.now("UTC").format("YYYYMMDD_HHmmss")
+            timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
             stem = file_path.stem
             suffix = file_path.suffix
             destination = duplicates_path / f"{stem}_{timestamp}{suffix}"
 
-        shutil.move(str(file_path), str(destination))
+        try:
+            # Same filesystem (the usual layout): a single rename syscall
+            os.replace(file_path, destination)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.move(str(file_path), str(destination))
         logger.info(
             f"[log_id={log.id}] Moved duplicate file {file_path.name} to duplicates directory: {destination}"
         )
 
     def _process_file(
-        self, file_path: Path, archive_path: Path, reader: BaseReader, log: FileLoadLog
+        self,
+        file_path: Path,
+        reader: BaseReader,
+        log: FileLoadLog,
+        archive_copy: Future,
     ) -> Iterator[Dict[str, Any]]:
-        self._copy_to_archive(file_path, archive_path, log)
-
-        log.processing_started_at = pendulum.now("UTC")
+        log.processing_started_at = datetime.now(UTC)
         records_processed = 0
         validation_errors = 0
-        sample_validation_errors = []
+        # Fixed-size sample for the threshold error message
+        sample_validation_errors = [None] * 5
+        sample_count = 0
         result = tuple()
 
-        field_mapping = create_field_mapping(reader)
+        source_model = reader.source.source_model
+        field_names = FieldNameResolver(create_field_mapping(reader))
         reverse_field_mapping = create_reverse_field_mapping(reader)
-        adapter = TypeAdapter(reader.source.source_model)
-
-        _sample_record = {
-            field: "" for field in reader.source.source_model.model_fields.keys()
-        }
-        sorted_field_keys = tuple(sorted(_sample_record.keys()))
-        del _sample_record
+        # Call the model's core validator directly; the validated instance's __dict__
+        # holds the field values, so no model_dump is needed for these flat models
+        validate_python = source_model.__pydantic_validator__.validate_python
+
+        row_hash = create_row_hasher(tuple(sorted(source_model.model_fields.keys())))
+        # Bind per-file values once instead of looking them up on every row
+        source_filename = file_path.name
+        log_id = log.id
+        grain = reader.source.grain
+        target_table_name = reader.source.table_name
+        serialize_json = self._serialize_json_for_dlq_table
 
         for index, record in enumerate(reader, start=reader.starting_row_number):
             passed = True
             # Rename alias keys to column names and trim unneeded columns
             record = {
-                field_mapping[k.lower()]: v
-                for k, v in record.items()
-                if k.lower() in field_mapping
+                field_name: value
+                for key, value in record.items()
+                if (field_name := field_names[key]) is not None
             }
             try:
-                record = adapter.validate_python(record).model_dump()
+                record = validate_python(record).__dict__
             except ValidationError as e:
                 validation_errors += 1
-                logger.debug(
-                    f"[log_id={log.id}] Validation failed for row {index} for file {file_path.name}: {e}"
-                )
+                # Formatting a ValidationError is expensive; skip it unless debug logging is on
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        f"[log_id={log_id}] Validation failed for row {index} for file {source_filename}: {e}"
+                    )
                 error_details = (
                     e.errors() if hasattr(e, "errors") else [{"msg": str(e)}]
                 )
-                failed_field_names = extract_failed_field_names(
-                    error_details, reader.source.grain
-                )
+                failed_field_names = extract_failed_field_names(error_details, grain)
 
                 # Filter record to only include failed fields and grain fields
                 # Convert field names back to column names (aliases) for DLQ
@@ -209,38 +328,33 @@ class FileProcessor:
                     if field_name in failed_field_names
                 }
 
-                if len(sample_validation_errors) <= 5:
-                    sample_validation_errors.append(
-                        {
-                            "file_row_number": index,
-                            "validation_error": extract_validation_error_message(
-                                error_details, reverse_field_mapping
-                            ),
-                            "record": record,
-                        }
-                    )
+                validation_error_message = extract_validation_error_message(
+                    error_details, reverse_field_mapping
+                )
+                # Keep a small, bounded sample for the threshold error message;
+                # the full record already goes to the DLQ
+                if sample_count < 5:
+                    sample_validation_errors[sample_count] = {
+                        "file_row_number": index,
+                        "validation_error": validation_error_message[:500],
+                    }
+                    sample_count += 1
                 passed = False
 
             if passed:
-                record["etl_row_hash"] = create_row_hash(
-                    record, sorted_keys=sorted_field_keys
-                )
-                record["source_filename"] = file_path.name
-                record["file_load_log_id"] = log.id
+                record["etl_row_hash"] = row_hash(record)
+                record["source_filename"] = source_filename
+                record["file_load_log_id"] = log_id
                 result = (record, True)
             else:
                 record = {
-                    "file_record_data": self._serialize_json_for_dlq_table(record),
-                    "validation_errors": self._serialize_json_for_dlq_table(
-                        extract_validation_error_message(
-                            error_details, reverse_field_mapping
-                        )
-                    ),
+                    "file_record_data": serialize_json(record),
+                    "validation_errors": serialize_json(validation_error_message),
                     "file_row_number": index,
-                    "source_filename": file_path.name,
-                    "file_load_log_id": log.id,
-                    "target_table_name": reader.source.table_name,
-                    "failed_at": pendulum.now("UTC"),
+                    "source_filename": source_filename,
+                    "file_load_log_id": log_id,
+                    "target_table_name": target_table_name,
+                    "failed_at": datetime.now(UTC),
                 }
                 result = (record, False)
 
@@ -260,94 +374,200 @@ class FileProcessor:
                     f"({threshold:.2%}) for file: {file_path.name}. "
                     f"Total Records Processed: {records_processed}, "
                     f"Failed Records: {validation_errors}. "
-                    f"Sample validation errors: {sample_validation_errors}"
+                    f"Sample validation errors: {sample_validation_errors[:sample_count]}"
                 )
                 raise ValidationThresholdExceededError(error_msg)
 
-        log.processing_ended_at = pendulum.now("UTC")
+        # The archive copy runs alongside parsing; it must have succeeded before the
+        # file counts as processed (raises the copy's exception otherwise)
+        archive_copy.result()
+
+        log.processing_ended_at = datetime.now(UTC)
         log.processing_success = True
 
+    def _get_worker_id(self) -> int:
+        worker_id = getattr(self._worker_local, "worker_id", None)
+        if worker_id is None:
+            worker_id = next(self._worker_ids)
+            self._worker_local.worker_id = worker_id
+        return worker_id
+
+    @retry()
+    def _get_or_create_stage_table(self, source: DataSource, log: FileLoadLog) -> Table:
+        """Return this worker's stage table for the source, emptied for a new file.
+
+        Each (source, worker) pair owns one stage table for the processor's lifetime,
+        so files only pay for a TRUNCATE instead of a CREATE and DROP each. A thread
+        only ever uses its own tables, so no two files share a stage table at once.
+        """
+        cache_key = (source.table_name, self._get_worker_id())
+        stage_table = self._stage_tables.get(cache_key)
+        if stage_table is None:
+            stage_table_name = (
+                f"stage_{source.table_name}_{self._stage_table_suffix}_{cache_key[1]}"
+            )
+            stage_table = create_stage_table(self.engine, source, stage_table_name, log)
+            self._stage_tables[cache_key] = stage_table
+            return stage_table
+
+        with self.engine.begin() as connection:
+            connection.execute(text(get_truncate_sql(stage_table.name)))
+        logger.debug(f"[log_id={log.id}] Truncated stage table: {stage_table.name}")
+        return stage_table
+
     def _load_records(
         self,
         results: Iterator[tuple[Dict[str, Any], bool]],
         reader: BaseReader,
         log: FileLoadLog,
+        archive_copy: Future,
     ) -> FileLoadLog:
-        log.stage_load_started_at = pendulum.now("UTC")
+        log.stage_load_started_at = datetime.now(UTC)
+        stage_load_start_ns = monotonic_ns()
         source_filename = reader.file_path.name
         target_table_name = reader.source.table_name
 
-        stage_table_name = create_stage_table(
-            self.engine, reader.source, source_filename, log
-        )
+        direct_upsert = self._use_direct_upsert(reader.source, log)
+        if direct_upsert:
+            upsert_stmt = create_upsert_statement(
+                self._get_target_table(reader.source),
+                reader.source,
+                log.stage_load_started_at,
+            )
+            dedupe_on_grain = self._get_grain_deduplicator(reader.source)
+            load_table_description = f"target table {target_table_name}"
+        else:
+            stage_table = self._get_or_create_stage_table(reader.source, log)
+            stage_table_name = stage_table.name
+            load_table_description = f"stage table {stage_table_name}"
 
-        # If not SQL Server, uses configured batch size
         batch_size = calculate_batch_size(reader.source)
         try:
-            stage_batch = []
             failed_batch = []
             records_stage_loaded = 0
             records_dlq_loaded = 0
+            target_inserts = 0
+            target_updates = 0
+            read_errors: list[Exception] = []
+
+            def read_results():
+                # Hold back an error raised while reading (e.g. the validation threshold)
+                # so rows already read still reach the stage table and DLQ first; a
+                # direct_upsert file is rolled back instead
+                try:
+                    yield from results
+                except Exception as e:
+                    read_errors.append(e)
+
+            # One connection for the whole stage load instead of a session per batch.
+            # direct_upsert publishes straight to the target, so the whole file (its
+            # upserts and DLQ rows) is one transaction on this connection, committed
+            # only once every row has been read without error.
+            with self.engine.connect() as stage_connection:
+                if direct_upsert:
+
+                    def insert_dlq_records(failed_records):
+                        self._insert_dlq_records_on_connection(
+                            failed_records, log, stage_connection
+                        )
 
-            try:
-                for record, passed in results:
-                    if passed:
-                        stage_batch.append(record)
+                else:
 
-                        if len(stage_batch) >= batch_size:
-                            self._insert_batch(stage_batch, stage_table_name, log)
+                    def insert_dlq_records(failed_records):
+                        self._insert_dlq_records(failed_records, log)
+
+                try:
+                    for chunk in itertools.batched(read_results(), batch_size):
+                        stage_batch = [record for record, passed in chunk if passed]
+                        if len(stage_batch) < len(chunk):
+                            failed_batch.extend(
+                                record for record, passed in chunk if not passed
+                            )
+
+                        if stage_batch:
+                            if direct_upsert:
+                                stage_batch = dedupe_on_grain(stage_batch)
+                                inserts, updates = self._upsert_batch(
+                                    stage_batch, upsert_stmt, log, stage_connection
+                                )
+                                target_inserts += inserts
+                                target_updates += updates
+                            else:
+                                self._insert_batch(
+                                    stage_batch, stage_table, log, stage_connection
+                                )
+                            previous_loaded = records_stage_loaded
                             records_stage_loaded += len(stage_batch)
-                            stage_batch = []
                             # Log progress every 100k records for large files, or every batch for smaller files
                             if (
-                                records_stage_loaded % 100000 == 0
-                                or records_stage_loaded < 100000
+                                records_stage_loaded < 100000
+                                or records_stage_loaded // 100000
+                                > previous_loaded // 100000
                             ):
                                 logger.info(
-                                    f"[log_id={log.id}] Loaded {records_stage_loaded:,} records so far into stage table {stage_table_name} from {source_filename}..."
+                                    f"[log_id={log.id}] Loaded {records_stage_loaded:,} records so far into {load_table_description} from {source_filename}..."
                                 )
 
-                    if not passed:
-                        logger.debug(
-                            f"[log_id={log.id}] Record failed validation, adding to DLQ batch. Row: {record.get('file_row_number', 'unknown')}, Batch size: {len(failed_batch) + 1}"
-                        )
-                        failed_batch.append(record)
                         if len(failed_batch) >= batch_size:
                             logger.info(
-                                f"[log_id={log.id}] DLQ batch size reached ({batch_size}), calling _insert_dlq_records"
+                                f"[log_id={log.id}] DLQ batch size reached ({batch_size}), inserting DLQ records"
                             )
-                            self._insert_dlq_records(failed_batch, log)
+                            insert_dlq_records(failed_batch)
+                            previous_loaded = records_dlq_loaded
                             records_dlq_loaded += len(failed_batch)
-                            failed_batch = []
+                            failed_batch.clear()
                             if (
-                                records_dlq_loaded % 100000 == 0
-                                or records_dlq_loaded < 100000
+                                records_dlq_loaded < 100000
+                                or records_dlq_loaded // 100000
+                                > previous_loaded // 100000
                             ):
                                 logger.info(
                                     f"[log_id={log.id}] Loaded {records_dlq_loaded:,} records so far into DLQ from {source_filename}..."
                                 )
-            finally:  # Insert remaining records in final batch
-                if stage_batch:
-                    self._insert_batch(stage_batch, stage_table_name, log)
-                    records_stage_loaded += len(stage_batch)
-                if failed_batch:
-                    self._insert_dlq_records(failed_batch, log)
-                    records_dlq_loaded += len(failed_batch)
+
+                    if failed_batch:
+                        insert_dlq_records(failed_batch)
+                        records_dlq_loaded += len(failed_batch)
+                    if read_errors:
+                        raise read_errors[0]
+                    if direct_upsert:
+                        stage_connection.commit()
+                except Exception:
+                    if direct_upsert:
+                        stage_connection.rollback()
+                        logger.warning(
+                            f"[log_id={log.id}] Rolled back direct upsert of {source_filename} into {load_table_description}"
+                        )
+                    raise
 
             logger.info(
-                f"[log_id={log.id}] Successfully loaded {records_stage_loaded:,} records into stage table {stage_table_name} and {records_dlq_loaded:,} records into DLQ"
+                f"[log_id={log.id}] Successfully loaded {records_stage_loaded:,} records into {load_table_description} and {records_dlq_loaded:,} records into DLQ "
+                f"in {(monotonic_ns() - stage_load_start_ns) / 1e9:.2f}s"
             )
-            log.stage_load_ended_at = pendulum.now("UTC")
+            log.stage_load_ended_at = datetime.now(UTC)
             log.records_stage_loaded = records_stage_loaded
             log.stage_load_success = True
 
-            log = self._audit_data(
-                stage_table_name, source_filename, reader.source, log
-            )
+            if direct_upsert:
+                # The load was the publish: no stage table to audit or merge from
+                log.audit_success = True
+                log.merge_started_at = log.stage_load_started_at
+                log.merge_ended_at = log.stage_load_ended_at
+                log.target_inserts = target_inserts
+                log.target_updates = target_updates
+                log.merge_success = True
+            else:
+                log = self._audit_data(
+                    stage_table_name, source_filename, reader.source, log
+                )
 
-            log = self._merge_stage_to_target(
-                stage_table_name, target_table_name, reader.source, source_filename, log
-            )
+                log = self._merge_stage_to_target(
+                    stage_table_name,
+                    target_table_name,
+                    reader.source,
+                    source_filename,
+                    log,
+                )
 
             # Only delete DLQ records if this is a reprocessing run (existing DLQ records from previous run)
             self._delete_dlq_records_if_reprocessing(source_filename, log)
@@ -355,39 +575,235 @@ class FileProcessor:
             return log
 
         finally:
-            reader.file_path.unlink()
-            logger.info(f"[log_id={log.id}] Deleted {source_filename}")
-            self._drop_stage_table(stage_table_name, log)
+            # Never delete the source before its archive copy has finished successfully
+            if archive_copy.exception() is None:
+                reader.file_path.unlink()
+                logger.info(f"[log_id={log.id}] Deleted {source_filename}")
+            else:
+                logger.warning(
+                    f"[log_id={log.id}] Keeping {source_filename} because the archive copy failed"
+                )
+
+    def _use_direct_upsert(self, source: DataSource, log: FileLoadLog) -> bool:
+        if not source.direct_upsert:
+            return False
+        if config.DRIVERNAME not in DIRECT_UPSERT_DRIVERS:
+            logger.warning(
+                f"[log_id={log.id}] direct_upsert is not supported on {config.DRIVERNAME}, loading {source.table_name} through a stage table"
+            )
+            return False
+        return True
+
+    def _get_target_table(self, source: DataSource) -> Table:
+        target_table = self._target_tables.get(source.table_name)
+        if target_table is None:
+            target_table = create_target_table(source, MetaData())
+            self._target_tables[source.table_name] = target_table
+        return target_table
+
+    def _get_grain_deduplicator(
+        self, source: DataSource
+    ) -> Callable[[list[Dict[str, Any]]], list[Dict[str, Any]]]:
+        """Return a function that keeps only the last row for each grain in a batch.
+
+        PostgreSQL sends a batch as one multi-row INSERT ... ON CONFLICT, which
+        cannot update the same row twice, so repeated grains are collapsed first.
+        Across batches the later row updates the earlier one, so the last row in
+        the file wins on every database.
+        """
+        get_grain = itemgetter(*source.grain)
+
+        def dedupe_on_grain(batch: list[Dict[str, Any]]) -> list[Dict[str, Any]]:
+            latest = {get_grain(record): record for record in batch}
+            if len(latest) == len(batch):
+                return batch
+            return list(latest.values())
+
+        return dedupe_on_grain
+
+    def _upsert_batch(
+        self,
+        batch: list[Dict[str, Any]],
+        upsert_stmt: Insert,
+        log: FileLoadLog,
+        connection: Connection,
+    ) -> tuple[int, int]:
+        """Upsert one batch into the target table, returning (inserts, updates).
+
+        Rows whose hash did not change are neither updated nor returned. The batch
+        runs inside the file's transaction: the caller commits once the whole file
+        has loaded and rolls back otherwise, so a failing file publishes nothing.
+        Nothing is retried here, since a failed statement aborts that transaction.
+        """
+        try:
+            returned = connection.execute(upsert_stmt, batch).all()
+        except Exception as e:
+            logger.exception(
+                f"[log_id={log.id}] Failed to upsert batch into {upsert_stmt.table.name}: {e}"
+            )
+            raise
+        inserts = sum(1 for (etl_updated_at,) in returned if etl_updated_at is None)
+        logger.debug(
+            f"[log_id={log.id}] Upserted {len(batch)} records into {upsert_stmt.table.name}"
+        )
+        return inserts, len(returned) - inserts
+
+    def _get_insert_statement(self, stage_table: Table) -> Insert:
+        """Return the cached INSERT construct for a stage (or DLQ) table.
+
+        Reusing the same construct lets SQLAlchemy's compiled cache hit on every batch
+        instead of rebuilding and recompiling the statement per batch.
+        """
+        insert_stmt = self._insert_stmt_cache.get(stage_table.name)
+        if insert_stmt is None:
+            insert_stmt = insert(stage_table)
+            self._insert_stmt_cache[stage_table.name] = insert_stmt
+        return insert_stmt
+
+    def _get_copy_statement(
+        self, stage_table_name: str, batch: list[Dict[str, Any]]
+    ) -> tuple[str, tuple[str, ...]]:
+        """Return the cached COPY statement and its column order for a stage table.
+
+        The column order is frozen from the first batch; every record comes from the
+        same model so later batches must carry the same keys.
+        """
+        cached = self._copy_stmt_cache.get(stage_table_name)
+        if cached is None:
+            columns = tuple(batch[0])
+            copy_sql = f"COPY {stage_table_name} ({', '.join(columns)}) FROM STDIN"
+            cached = (copy_sql, columns)
+            self._copy_stmt_cache[stage_table_name] = cached
+        assert tuple(batch[0]) == cached[1], (
+            f"Batch columns do not match cached COPY columns for {stage_table_name}"
+        )
+        return cached
+
+    def _get_positional_insert(
+        self, stage_table: Table, batch: list[Dict[str, Any]], dialect
+    ) -> tuple[str, tuple[str, ...], tuple[Callable | None, ...]] | None:
+        """Return a cached positional INSERT, its column order and bind processors.
+
+        Sending rows as tuples to the driver skips SQLAlchemy's per-row named
+        parameter handling. The type bind processors SQLAlchemy would have applied
+        are resolved once here so values reach the driver unchanged from before.
+        Returns None for paramstyles that cannot take positional rows.
+        """
+        if dialect.paramstyle == "qmark":
+            placeholder = "?"
+        elif dialect.paramstyle in ("format", "pyformat"):
+            placeholder = "%s"
+        else:
+            return None
+
+        cached = self._positional_insert_cache.get(stage_table.name)
+        if cached is None:
+            columns = tuple(batch[0])
+            quote = dialect.identifier_preparer.quote
+            insert_sql = (
+                f"INSERT INTO {quote(stage_table.name)} "
+                f"({', '.join(quote(col) for col in columns)}) "
+                f"VALUES ({', '.join([placeholder] * len(columns))})"
+            )
+            processors = tuple(
+                stage_table.c[col].type.dialect_impl(dialect).bind_processor(dialect)
+                for col in columns
+            )
+            cached = (insert_sql, columns, processors)
+            self._positional_insert_cache[stage_table.name] = cached
+        assert tuple(batch[0]) == cached[1], (
+            f"Batch columns do not match cached INSERT columns for {stage_table.name}"
+        )
+        return cached
 
     @retry()
     def _insert_batch(
-        self, batch: list[Dict[str, Any]], table_name: str, log: FileLoadLog
+        self,
+        batch: list[Dict[str, Any]],
+        stage_table: Table,
+        log: FileLoadLog,
+        connection: Connection,
     ):
+        """Insert one batch into the stage table on the stage load's connection.
+
+        Each batch is committed on its own so a retry only has to replay the batch
+        that failed; the rollback leaves earlier batches in place.
+        """
+        table_name = stage_table.name
         drivername = config.DRIVERNAME
         if drivername == "mssql" and config.SQL_SERVER_SQLBULKCOPY_FLAG:
             bulk_insert(config.DATABASE_URL, table_name, batch, log)
             return
+        if drivername == "postgresql":
+            self._copy_batch(batch, stage_table, log, connection)
+            return
 
-        columns = list(batch[0].keys())
-
-        placeholders = ", ".join([f":{col}" for col in columns])
-        insert_sql = (
-            f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({placeholders})"
+        positional_insert = self._get_positional_insert(
+            stage_table, batch, connection.dialect
         )
 
-        with self.Session() as session:
-            try:
-                session.execute(text(insert_sql), batch)
-                session.commit()
-                logger.debug(
-                    f"[log_id={log.id}] Inserted {len(batch)} records into {table_name}"
-                )
-            except Exception as e:
-                session.rollback()
-                logger.exception(
-                    f"[log_id={log.id}] Failed to insert batch into {table_name}: {e}"
-                )
-                raise
+        try:
+            if positional_insert is None:
+                connection.execute(self._get_insert_statement(stage_table), batch)
+            else:
+                insert_sql, columns, processors = positional_insert
+                get_row = itemgetter(*columns)
+                if any(processors):
+                    rows = [
+                        tuple(
+                            value if process is None else process(value)
+                            for process, value in zip(processors, get_row(record))
+                        )
+                        for record in batch
+                    ]
+                else:
+                    rows = [get_row(record) for record in batch]
+                connection.exec_driver_sql(insert_sql, rows)
+            connection.commit()
+            logger.debug(
+                f"[log_id={log.id}] Inserted {len(batch)} records into {table_name}"
+            )
+        except Exception as e:
+            connection.rollback()
+            logger.exception(
+                f"[log_id={log.id}] Failed to insert batch into {table_name}: {e}"
+            )
+            raise
+
+    def _copy_batch(
+        self,
+        batch: list[Dict[str, Any]],
+        stage_table: Table,
+        log: FileLoadLog,
+        connection: Connection,
+    ):
+        """Load a batch into a Postgres stage table with COPY FROM STDIN.
+
+        COPY skips per-row statement parsing and is the fastest ingest path for the
+        append-only stage table. Text format is used on purpose: binary COPY needs
+        every value to match the column's wire type exactly, and float fields are
+        stored in NUMERIC columns. psycopg buffers the rows and flushes them in
+        large chunks itself.
+        """
+        copy_sql, columns = self._get_copy_statement(stage_table.name, batch)
+
+        try:
+            # psycopg connection underneath the SQLAlchemy pool proxy
+            driver_connection = connection.connection.driver_connection
+            with driver_connection.cursor() as cursor:
+                with cursor.copy(copy_sql) as copy:
+                    for record in batch:
+                        copy.write_row([record[col] for col in columns])
+            connection.commit()
+            logger.debug(
+                f"[log_id={log.id}] Copied {len(batch)} records into {stage_table.name}"
+            )
+        except Exception as e:
+            connection.rollback()
+            logger.exception(
+                f"[log_id={log.id}] Failed to copy batch into {stage_table.name}: {e}"
+            )
+            raise
 
     @retry()
     def _validate_grain(
@@ -438,13 +854,13 @@ class FileProcessor:
         source: DataSource,
         log: FileLoadLog,
     ) -> FileLoadLog:
-        log.audit_started_at = pendulum.now("UTC")
+        log.audit_started_at = datetime.now(UTC)
 
         self._validate_grain(source, stage_table_name, source_filename)
 
         # If no custom audit_query is provided, only grain validation runs
         if source.audit_query is None:
-            log.audit_ended_at = pendulum.now("UTC")
+            log.audit_ended_at = datetime.now(UTC)
             log.audit_success = True
             return log
 
@@ -461,8 +877,9 @@ class FileProcessor:
                 if value == 0:
                     failed_audits.append(audit_name)
 
+            audit_ended_at = datetime.now(UTC)
             if failed_audits:
-                log.audit_ended_at = pendulum.now("UTC")
+                log.audit_ended_at = audit_ended_at
                 log.audit_success = False
 
                 error_msg_parts = [
@@ -473,10 +890,77 @@ class FileProcessor:
 
                 error_msg = "\n".join(error_msg_parts)
                 raise AuditFailedError(error_msg)
-            log.audit_ended_at = pendulum.now("UTC")
+            log.audit_ended_at = audit_ended_at
             log.audit_success = True
             return log
 
+    def _get_merge_statements(
+        self, stage_table_name: str, target_table_name: str, source: DataSource
+    ) -> tuple[TextClause | None, TextClause | None, TextClause]:
+        """Return the (existing count, update count, merge) statements for a stage/target pair.
+
+        The SQL text only depends on the table names and the source, so it is built once
+        and reused; the ETL timestamp is passed as the `:etl_now` bind parameter. The
+        count statements are None where the merge returns its own counts.
+        """
+        cache_key = (stage_table_name, target_table_name)
+        statements = self._merge_sql_cache.get(cache_key)
+        if statements is not None:
+            return statements
+
+        columns = [
+            col.name for col in get_table_columns(source, include_timestamps=False)
+        ]
+
+        join_condition = " AND ".join(
+            [f"target.{col} = stage.{col}" for col in source.grain]
+        )
+
+        update_columns = [col for col in columns if col not in source.grain]
+
+        merge_sql = text(
+            create_merge_sql(
+                stage_table_name=stage_table_name,
+                target_table_name=target_table_name,
+                join_condition=join_condition,
+                columns=columns,
+                update_columns=update_columns,
+                grain=source.grain,
+            )
+        )
+        if config.DRIVERNAME in MERGE_COUNTING_DRIVERS:
+            statements = (None, None, merge_sql)
+            self._merge_sql_cache[cache_key] = statements
+            return statements
+
+        # Get Estimated Target Inserts and Updates
+        # EXISTS is more performant than NOT EXISTS
+        insert_sql = text(f"""
+        SELECT 
+        COUNT(*) 
+        FROM {stage_table_name} AS stage
+        WHERE EXISTS (
+            SELECT 1 
+            FROM {target_table_name} AS target
+            WHERE {join_condition}
+        )""")
+
+        update_sql = text(f"""
+        SELECT 
+        COUNT(*) 
+        FROM {stage_table_name} AS stage
+        WHERE EXISTS (
+            SELECT 1 
+            FROM {target_table_name} AS target
+            WHERE {join_condition}
+            AND stage.etl_row_hash != target.etl_row_hash
+        ) 
+        """)
+
+        statements = (insert_sql, update_sql, merge_sql)
+        self._merge_sql_cache[cache_key] = statements
+        return statements
+
     @retry()
     def _merge_stage_to_target(
         self,
@@ -488,66 +972,35 @@ class FileProcessor:
     ) -> FileLoadLog:
         with self.Session() as session:
             try:
-                log.merge_started_at = pendulum.now("UTC")
-                columns = [
-                    col.name
-                    for col in get_table_columns(source, include_timestamps=False)
-                ]
+                # Same instant for the log row and the etl_created_at/etl_updated_at values
+                merge_started_at = datetime.now(UTC)
+                merge_start_ns = monotonic_ns()
+                log.merge_started_at = merge_started_at
 
-                join_condition = " AND ".join(
-                    [f"target.{col} = stage.{col}" for col in source.grain]
+                insert_sql, update_sql, merge_sql = self._get_merge_statements(
+                    stage_table_name, target_table_name, source
                 )
 
-                now_iso = format_datetime_for_db(pendulum.now("UTC"))
-
-                update_columns = [col for col in columns if col not in source.grain]
-
-                # Get Estimated Target Inserts and Updates
-                # EXISTS is more performant than NOT EXISTS
-                insert_sql = text(f"""
-                SELECT 
-                COUNT(*) 
-                FROM {stage_table_name} AS stage
-                WHERE EXISTS (
-                    SELECT 1 
-                    FROM {target_table_name} AS target
-                    WHERE {join_condition}
-                )""")
-                existing_records = session.execute(insert_sql).scalar()
-                log.target_inserts = log.records_stage_loaded - existing_records
-
-                update_sql = text(f"""
-                SELECT 
-                COUNT(*) 
-                FROM {stage_table_name} AS stage
-                WHERE EXISTS (
-                    SELECT 1 
-                    FROM {target_table_name} AS target
-                    WHERE {join_condition}
-                    AND stage.etl_row_hash != target.etl_row_hash
-                ) 
-                """)
-                new_updates = session.execute(update_sql).scalar()
-                log.target_updates = new_updates
-
-                merge_sql = text(
-                    create_merge_sql(
-                        stage_table_name=stage_table_name,
-                        target_table_name=target_table_name,
-                        join_condition=join_condition,
-                        columns=columns,
-                        update_columns=update_columns,
-                        grain=source.grain,
-                        now_iso=now_iso,
-                    )
-                )
+                merge_params = {"etl_now": format_datetime_for_db(merge_started_at)}
+                if insert_sql is None:
+                    # One pass: the merge reports what it inserted and updated
+                    counts = session.execute(merge_sql, merge_params).one()
+                    log.target_inserts = counts.target_inserts
+                    log.target_updates = counts.target_updates
+                else:
+                    existing_records = session.execute(insert_sql).scalar()
+                    log.target_inserts = log.records_stage_loaded - existing_records
+
+                    new_updates = session.execute(update_sql).scalar()
+                    log.target_updates = new_updates
 
-                session.execute(merge_sql)
+                    session.execute(merge_sql, merge_params)
                 session.commit()
-                log.merge_ended_at = pendulum.now("UTC")
+                log.merge_ended_at = datetime.now(UTC)
                 log.merge_success = True
                 logger.info(
-                    f"[log_id={log.id}] Successfully performed merge from {stage_table_name} to {target_table_name}: {log.target_inserts} inserts, {log.target_updates} updates"
+                    f"[log_id={log.id}] Successfully performed merge from {stage_table_name} to {target_table_name}: {log.target_inserts} inserts, {log.target_updates} updates "
+                    f"in {(monotonic_ns() - merge_start_ns) / 1e9:.2f}s"
                 )
                 return log
 
@@ -611,20 +1064,29 @@ class FileProcessor:
                 raise
 
     @retry()
-    def _drop_stage_table(self, stage_table_name: str, log: FileLoadLog):
+    def _drop_stage_table(self, stage_table_name: str):
+        self._insert_stmt_cache.pop(stage_table_name, None)
+        self._copy_stmt_cache.pop(stage_table_name, None)
+        self._positional_insert_cache.pop(stage_table_name, None)
         with self.Session() as session:
             try:
                 drop_sql = text(f"DROP TABLE IF EXISTS {stage_table_name}")
                 session.execute(drop_sql)
                 session.commit()
-                logger.info(
-                    f"[log_id={log.id}] Dropped stage table: {stage_table_name}"
-                )
+                logger.info(f"Dropped stage table: {stage_table_name}")
             except Exception as e:
                 session.rollback()
-                logger.warning(
-                    f"[log_id={log.id}] Failed to drop stage table {stage_table_name}: {e}"
-                )
+                logger.warning(f"Failed to drop stage table {stage_table_name}: {e}")
+
+    def _drop_stage_tables(self):
+        """Drop every stage table created by this processor, in parallel."""
+        stage_tables, self._stage_tables = self._stage_tables, {}
+        wait(
+            [
+                self.thread_pool.submit(self._drop_stage_table, stage_table.name)
+                for stage_table in stage_tables.values()
+            ]
+        )
 
     def _serialize_json_for_dlq_table(self, data: Any) -> Any:
         drivername = config.DRIVERNAME
@@ -654,16 +1116,16 @@ class FileProcessor:
 
         drivername = config.DRIVERNAME
         if drivername == "mssql" and config.SQL_SERVER_SQLBULKCOPY_FLAG:
-            table_name = "file_load_dlq"
-            bulk_insert(config.DATABASE_URL, table_name, failed_records, log)
+            bulk_insert(config.DATABASE_URL, file_load_dlq.name, failed_records, log)
             return
 
-        dlq_table = self._get_file_load_dlq()
+        # executemany with a reused statement instead of one multi-row VALUES
+        # statement whose SQL text (and parameter count) changes with every batch size
+        insert_stmt = self._get_insert_statement(self._get_file_load_dlq())
 
         with self.Session() as session:
             try:
-                stmt = insert(dlq_table).values(failed_records)
-                session.execute(stmt)
+                session.execute(insert_stmt, failed_records)
                 session.commit()
                 logger.debug(
                     f"[log_id={log.id}] Inserted {len(failed_records)} failed records into DLQ"
@@ -675,155 +1137,208 @@ class FileProcessor:
                 )
                 raise
 
-    def _process_file_batch(self, batch: List[str], archive_path: Path) -> list[dict]:
-        results: list[dict] = []
-        duplicates_path = config.DUPLICATE_FILES_PATH
-        log = None
-        tracer = trace.get_tracer(__name__)
+    def _insert_dlq_records_on_connection(
+        self,
+        failed_records: List[Dict[str, Any]],
+        log: FileLoadLog,
+        connection: Connection,
+    ) -> None:
+        """Insert DLQ records inside the caller's transaction, without committing.
 
-        for file_path_str in batch:
-            file_path = Path(file_path_str)
+        direct_upsert loads use this so a file's DLQ rows commit or roll back
+        together with its upserts.
+        """
+        try:
+            connection.execute(
+                self._get_insert_statement(self._get_file_load_dlq()), failed_records
+            )
+            logger.debug(
+                f"[log_id={log.id}] Inserted {len(failed_records)} failed records into DLQ"
+            )
+        except Exception as e:
+            logger.exception(
+                f"[log_id={log.id}] Failed to insert records into DLQ: {e}"
+            )
+            raise
 
-            with tracer.start_as_current_span(
-                f"FILE: {file_path.name}",
-            ):
-                try:
-                    reader = self._get_reader(file_path)
-                    if not reader:
-                        logger.warning(
-                            f"[log_id=N/A] No reader found for file: {file_path.name}"
-                        )
-                        continue
+    def _process_single_file(
+        self, file_path_str: str, archive_path: Path
+    ) -> dict | None:
+        """Process one file end to end; returns its result, or None if it was skipped."""
+        duplicates_path = config.DUPLICATE_FILES_PATH
+        tracer = trace.get_tracer(__name__)
+        file_path = Path(file_path_str)
+        log = None
 
-                    source_filename = reader.file_path.name
-                    log = FileLoadLog(
-                        source_filename=source_filename,
-                        started_at=pendulum.now("UTC"),
+        with tracer.start_as_current_span(
+            f"FILE: {file_path.name}",
+        ):
+            file_start_ns = monotonic_ns()
+            try:
+                reader = self._get_reader(file_path)
+                if not reader:
+                    logger.warning(
+                        f"[log_id=N/A] No reader found for file: {file_path.name}"
                     )
-                    log.id = self._log_start(log.source_filename, log.started_at)
+                    return None
 
-                    if self._check_duplicate_file(reader.source, source_filename):
-                        logger.warning(
-                            f"[log_id={log.id}] File {source_filename} has already been processed - moving to duplicates directory"
-                        )
-                        self._move_to_duplicates(file_path, duplicates_path, log)
-                        log.duplicate_skipped = True
-
-                        if reader.source.notification_emails:
-                            error_message = (
-                                f"The file {source_filename} has already been processed and has been moved to the duplicates directory.\n\n"
-                                f"To reprocess this file:\n"
-                                f"1. Existing records need to be removed from the target table where source_filename = '{source_filename}'\n"
-                                f"2. Move the file from the duplicates directory back to the processing directory"
-                            )
-                            send_failure_notification(
-                                file_name=source_filename,
-                                error_type="Duplicate File Detected",
-                                error_message=error_message,
-                                log_id=log.id,
-                                recipient_emails=reader.source.notification_emails,
-                            )
-                        self._log_update(log)
-                        continue
-                    try:
-                        records_iterator = self._process_file(
-                            file_path, archive_path, reader, log
-                        )
-                        log = self._load_records(records_iterator, reader, log)
-                        log.success = True
-                    finally:
-                        log.ended_at = pendulum.now("UTC")
-                        log.success = False if log.success is None else log.success
-                        self._log_update(log)
-
-                    results.append(
-                        log.model_dump(include={"id", "source_filename", "success"})
+                source_filename = reader.file_path.name
+                log = FileLoadLog(
+                    source_filename=source_filename,
+                    started_at=datetime.now(UTC),
+                )
+                log.id = self._log_start(log.source_filename, log.started_at)
+
+                if self._check_duplicate_file(reader.source, source_filename):
+                    logger.warning(
+                        f"[log_id={log.id}] File {source_filename} has already been processed - moving to duplicates directory"
                     )
-                except tuple(FILE_ERROR_EXCEPTIONS) as e:
-                    logger.exception(f"[log_id={log.id}] {e}")
+                    self._move_to_duplicates(file_path, duplicates_path, log)
+                    log.duplicate_skipped = True
 
                     if reader.source.notification_emails:
+                        error_message = (
+                            f"The file {source_filename} has already been processed and has been moved to the duplicates directory.\n\n"
+                            f"To reprocess this file:\n"
+                            f"1. Existing records need to be removed from the target table where source_filename = '{source_filename}'\n"
+                            f"2. Move the file from the duplicates directory back to the processing directory"
+                        )
                         send_failure_notification(
-                            file_name=file_path.name,
-                            error_type=e.error_type,
-                            error_message=str(e),
+                            file_name=source_filename,
+                            error_type="Duplicate File Detected",
+                            error_message=error_message,
                             log_id=log.id,
                             recipient_emails=reader.source.notification_emails,
                         )
+                    self._log_update(log)
+                    return None
+                try:
+                    # Archive in the background while the file is parsed and staged
+                    archive_copy = self._archive_pool.submit(
+                        self._copy_to_archive, file_path, archive_path, log
+                    )
+                    records_iterator = self._process_file(
+                        file_path, reader, log, archive_copy
+                    )
+                    log = self._load_records(
+                        records_iterator, reader, log, archive_copy
+                    )
+                    log.success = True
+                finally:
+                    log.ended_at = datetime.now(UTC)
+                    log.success = False if log.success is None else log.success
+                    self._log_update(log)
+
+                return log.model_dump(include={"id", "source_filename", "success"})
+            except FILE_ERROR_EXCEPTION_TYPES as e:
+                logger.exception(f"[log_id={log.id}] {e}")
+
+                if reader.source.notification_emails:
+                    send_failure_notification(
+                        file_name=file_path.name,
+                        error_type=e.error_type,
+                        error_message=str(e),
+                        log_id=log.id,
+                        recipient_emails=reader.source.notification_emails,
+                    )
 
-                    log.ended_at = pendulum.now("UTC")
+                log.ended_at = datetime.now(UTC)
+                log.success = False
+                log.error_type = e.error_type
+                self._log_update(log)
+                return {
+                    "id": log.id,
+                    "source_filename": file_path.name,
+                    "success": False,
+                    "error_type": e.error_type,
+                    "error_message": str(e),
+                    "error_location": get_error_location(e),
+                }
+            except Exception as e:
+                log_id = log.id if log else "N/A"
+                logger.exception(f"[log_id={log_id}] {e}")
+
+                if log:
+                    log.ended_at = datetime.now(UTC)
                     log.success = False
-                    log.error_type = e.error_type
+                    log.error_type = type(e).__name__
                     self._log_update(log)
-                    results.append(
-                        {
-                            "id": log.id,
-                            "source_filename": file_path.name,
-                            "success": False,
-                            "error_type": e.error_type,
-                            "error_message": str(e),
-                            "error_location": get_error_location(e),
-                        }
-                    )
-                except Exception as e:
-                    log_id = log.id if log else "N/A"
-                    logger.exception(f"[log_id={log_id}] {e}")
-
-                    if log:
-                        log.ended_at = pendulum.now("UTC")
-                        log.success = False
-                        log.error_type = type(e).__name__
-                        self._log_update(log)
-                    results.append(
-                        {
-                            "id": log.id if log else None,
-                            "source_filename": file_path.name,
-                            "success": False,
-                            "error_type": type(e).__name__,
-                            "error_message": str(e),
-                            "error_location": get_error_location(e),
-                        }
+                return {
+                    "id": log.id if log else None,
+                    "source_filename": file_path.name,
+                    "success": False,
+                    "error_type": type(e).__name__,
+                    "error_message": str(e),
+                    "error_location": get_error_location(e),
+                }
+            finally:
+                if log:
+                    logger.info(
+                        f"[log_id={log.id}] Finished {file_path.name} in {(monotonic_ns() - file_start_ns) / 1e9:.2f}s"
                     )
-        return results
 
     def process_files_parallel(
-        self, file_paths: List[str], archive_path: Path
+        self, file_paths: List[str], archive_path: Path, fail_fast: bool = False
     ) -> list[dict]:
-        """Process multiple files in parallel using thread pool."""
-
-        # Divide files evenly among threads
-        # Example: 4 threads, 17 files
-        # files_per_thread = 17 // 4 = 4
-        # remainder = 17 % 4 = 1
-        # Thread 0: 4 + 1 = 5 files (gets extra)
-        # Thread 1: 4 + 0 = 4 files
-        # Thread 2: 4 + 0 = 4 files
-        # Thread 3: 4 + 0 = 4 files
-        num_threads = self.thread_pool._max_workers
-        files_per_thread = len(file_paths) // num_threads
-        remainder = len(file_paths) % num_threads
-
-        # Create file batches for each thread
-        file_batches = []
-        start = 0
-        for index in range(num_threads):
-            batch_size = files_per_thread + (1 if index < remainder else 0)
-            end = start + batch_size
-            batch = file_paths[start:end]
-            if batch:  # Only add non-empty batches
-                file_batches.append(batch)
-            start = end
-
-        with ThreadPoolExecutor(max_workers=num_threads) as executor:
-            batch_futures = [
-                executor.submit(self._process_file_batch, batch, archive_path)
-                for batch in file_batches
-            ]
-            batch_results = [future.result() for future in batch_futures]
+        """Process multiple files in parallel using thread pool.
+
+        Files are submitted individually so the pool's work queue balances uneven
+        file sizes, and results are collected as files finish. With `fail_fast`,
+        files that have not started yet are cancelled after the first failure.
+        With PROCESS_POOL_FLAG, files run in worker processes instead so parsing,
+        validation and hashing use every core.
+        """
+        process_pool = None
+        if config.PROCESS_POOL_FLAG:
+            # spawn: forking a parent that already runs pool and log writer threads is unsafe
+            process_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count(), mp_context=get_context("spawn")
+            )
+            futures = {
+                process_pool.submit(
+                    _process_file_in_worker, file_path, archive_path
+                ): file_path
+                for file_path in file_paths
+            }
+        else:
+            futures = {
+                self.thread_pool.submit(
+                    self._process_single_file, file_path, archive_path
+                ): file_path
+                for file_path in file_paths
+            }
 
         all_results = []
-        for batch_result in batch_results:
-            all_results.extend(batch_result)
+        worker_stage_tables = set()
+        try:
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+                result = future.result()
+                if process_pool is not None:
+                    result, stage_table_names = result
+                    worker_stage_tables.update(stage_table_names)
+                if result is None:
+                    continue
+                all_results.append(result)
+                if fail_fast and result.get("success") is False:
+                    cancelled = sum(pending.cancel() for pending in futures)
+                    logger.warning(
+                        f"Fail fast: {futures[future]} failed, cancelled {cancelled} pending files"
+                    )
+        finally:
+            if process_pool is not None:
+                process_pool.shutdown(wait=True)
+
+            self._drop_stage_tables()
+            wait(
+                [
+                    self.thread_pool.submit(self._drop_stage_table, stage_table_name)
+                    for stage_table_name in worker_stage_tables
+                ]
+            )
+            # Raises if a log update could not be written
+            self._flush_log_updates()
 
         successful = sum(1 for r in all_results if r.get("success") is True)
         failed = len(all_results) - successful
@@ -834,7 +1349,44 @@ class FileProcessor:
         return all_results
 
     def __del__(self):
+        # Safety net for runs that did not reach the end of process_files_parallel
+        if hasattr(self, "_stage_tables"):
+            for stage_table in self._stage_tables.values():
+                self._drop_stage_table(stage_table.name)
+        if hasattr(self, "_log_writer"):
+            try:
+                self._flush_log_updates()
+            except RuntimeError as e:
+                logger.error(str(e))
+            self._log_queue.put(None)
         if hasattr(self, "thread_pool"):
             self.thread_pool.shutdown(wait=True)
+        if hasattr(self, "_archive_pool"):
+            self._archive_pool.shutdown(wait=True)
         if hasattr(self, "engine"):
             self.engine.dispose(close=True)
+
+
+_worker_processor: FileProcessor | None = None
+
+
+def _process_file_in_worker(
+    file_path_str: str, archive_path: Path
+) -> tuple[dict | None, list[str]]:
+    """Process one file inside a worker process of the PROCESS_POOL_FLAG pool.
+
+    Each worker builds one FileProcessor on first use and keeps it, so its engine
+    and stage tables are reused across the files it is given. The stage table
+    names are returned so the parent can drop them when the run ends.
+    """
+    global _worker_processor
+    if _worker_processor is None:
+        _worker_processor = FileProcessor(create_schema=False)
+    result = _worker_processor._process_single_file(file_path_str, archive_path)
+    # The worker may be shut down before its log writer and Slack notifier threads
+    # get another turn, and worker processes skip atexit handlers
+    _worker_processor._flush_log_updates()
+    flush_slack_notifications()
+    return result, [
+        stage_table.name for stage_table in _worker_processor._stage_tables.values()
+    ]
@@ -1,9 +1,9 @@
+import atexit
+import logging
 from logging.config import dictConfig
 
 from opentelemetry import trace
 from opentelemetry._logs import set_logger_provider
-from opentelemetry.exporter.otlp.proto.http._log_exporter import OTLPLogExporter
-from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
 from opentelemetry.sdk._logs import LoggerProvider, LoggingHandler
 from opentelemetry.sdk._logs.export import BatchLogRecordProcessor
 from opentelemetry.sdk.trace import TracerProvider
@@ -22,6 +22,14 @@ def setup_logging():
     set_logger_provider(logger_provider)
 
     if isinstance(config, ProdConfig):
+        # Exporters pull in protobuf and requests, so only import them when used
+        from opentelemetry.exporter.otlp.proto.http._log_exporter import (
+            OTLPLogExporter,
+        )
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+            OTLPSpanExporter,
+        )
+
         # Setup OpenTelemetry tracing exporter
         trace_exporter = OTLPSpanExporter(
             endpoint=config.OPEN_TELEMETRY_TRACE_ENDPOINT,
@@ -69,12 +77,22 @@ def setup_logging():
         }
     }
 
+    # Console formatting runs on a QueueListener thread so logging calls on hot
+    # paths only enqueue. The OTel handler stays direct: it already exports in the
+    # background (BatchLogRecordProcessor) and must read the span context of the
+    # thread that logged for trace correlation.
+    handlers["queue"] = {
+        "class": "logging.handlers.QueueHandler",
+        "handlers": ["default"],
+        "respect_handler_level": True,
+    }
+
     # Declare src logger as the root logger
     # Any other loggers will be children of src and inherit the settings
     loggers = {
         "src": {
             "level": config.LOG_LEVEL,
-            "handlers": list(handlers.keys()),
+            "handlers": [name for name in handlers if name != "default"],
             "propagate": False,
         }
     }
@@ -88,3 +106,7 @@ def setup_logging():
             "loggers": loggers,
         }
     )
+
+    queue_listener = logging.getHandlerByName("queue").listener
+    queue_listener.start()
+    atexit.register(queue_listener.stop)
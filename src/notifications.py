@@ -1,12 +1,13 @@
+import atexit
 import logging
+import queue
 import smtplib
-import textwrap
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+import threading
+from datetime import UTC, datetime
+from email.message import EmailMessage
 from enum import Enum
 from typing import Any, Dict, Optional
 
-import pendulum
 from slack_sdk.webhook import WebhookClient
 
 from src.retry import retry
@@ -15,6 +16,178 @@ from src.settings import config
 logger = logging.getLogger(__name__)
 
 
+class _SMTPPool:
+    """One shared SMTP session reused across notification emails.
+
+    Connecting, STARTTLS and login dominate the cost of a single email, so the
+    session is kept open and checked with NOOP before reuse. smtplib sessions are
+    not thread-safe, so sends are serialized on a lock. The session is replaced
+    after `max_messages` sends or any failure.
+    """
+
+    def __init__(self, max_messages: int = 100):
+        self.max_messages = max_messages
+        self._lock = threading.Lock()
+        self._server: Optional[smtplib.SMTP] = None
+        self._messages_sent = 0
+
+    def _connect(self) -> smtplib.SMTP:
+        # Use SMTP_SSL for port 465, regular SMTP for other ports
+        if config.SMTP_PORT == 465:
+            server = smtplib.SMTP_SSL(config.SMTP_HOST, config.SMTP_PORT)
+        else:
+            server = smtplib.SMTP(config.SMTP_HOST, config.SMTP_PORT)
+
+        try:
+            if config.SMTP_USER and config.SMTP_PASSWORD:
+                # Only start TLS if not using SSL (port 465)
+                if config.SMTP_PORT != 465:
+                    server.starttls()
+                server.login(config.SMTP_USER, config.SMTP_PASSWORD)
+        except Exception:
+            server.close()
+            raise
+        return server
+
+    def _get(self) -> smtplib.SMTP:
+        if self._server is not None and self._messages_sent < self.max_messages:
+            try:
+                if self._server.noop()[0] == 250:
+                    return self._server
+            except (smtplib.SMTPException, OSError):
+                pass
+        self._close()
+        self._server = self._connect()
+        self._messages_sent = 0
+        return self._server
+
+    def _close(self) -> None:
+        if self._server is None:
+            return
+        try:
+            self._server.quit()
+        except (smtplib.SMTPException, OSError):
+            self._server.close()
+        self._server = None
+
+    def send_message(
+        self, message: EmailMessage, from_addr: str, to_addrs: list[str]
+    ) -> None:
+        with self._lock:
+            server = self._get()
+            try:
+                server.send_message(message, from_addr=from_addr, to_addrs=to_addrs)
+            except Exception:
+                # Drop the session so a retry starts from a fresh connection
+                self._close()
+                raise
+            self._messages_sent += 1
+
+    def close(self) -> None:
+        with self._lock:
+            self._close()
+
+
+_smtp_pool = _SMTPPool()
+atexit.register(_smtp_pool.close)
+
+
+# Slack messages are posted by one background thread so callers never wait on the
+# webhook round trip or its retry backoff. When the queue is full the oldest
+# pending message is dropped.
+_SLACK_QUEUE_SIZE = 256
+_slack_queue: queue.Queue[Optional[tuple[str, str]]] = queue.Queue(_SLACK_QUEUE_SIZE)
+_slack_worker: Optional[threading.Thread] = None
+_slack_worker_lock = threading.Lock()
+
+
+@retry()
+def _post_slack_message(webhook: WebhookClient, text: str) -> None:
+    response = webhook.send(text=text)
+    if response.status_code == 200:
+        logger.info("Sent Slack notification for internal processing error")
+    else:
+        raise Exception(
+            f"Slack webhook returned status {response.status_code}: {response.body}"
+        )
+
+
+def _run_slack_worker() -> None:
+    # One client per webhook URL, reused across messages
+    webhooks: Dict[str, WebhookClient] = {}
+    while True:
+        item = _slack_queue.get()
+        try:
+            if item is None:
+                return
+            url, text = item
+            webhook = webhooks.get(url)
+            if webhook is None:
+                webhook = webhooks[url] = WebhookClient(url)
+            try:
+                _post_slack_message(webhook, text)
+            except Exception as e:
+                logger.exception(
+                    f"Failed to send Slack notification after retries: {e}"
+                )
+        finally:
+            _slack_queue.task_done()
+
+
+def _flush_slack_notifications() -> None:
+    """Wait for queued Slack messages to be sent and stop the worker."""
+    global _slack_worker
+    with _slack_worker_lock:
+        worker, _slack_worker = _slack_worker, None
+    if worker is None:
+        return
+    _slack_queue.put(None)
+    worker.join()
+
+
+def flush_slack_notifications() -> None:
+    """Block until every queued Slack message has been sent, keeping the worker.
+
+    Worker processes of the process pool call this before handing back a result:
+    they do not run atexit handlers and the notifier is a daemon thread, so
+    anything still queued would be lost when the pool shuts down.
+    """
+    with _slack_worker_lock:
+        worker = _slack_worker
+    if worker is not None and worker.is_alive():
+        _slack_queue.join()
+
+
+def _enqueue_slack_message(url: str, text: str) -> None:
+    global _slack_worker
+    with _slack_worker_lock:
+        if _slack_worker is None:
+            _slack_worker = threading.Thread(
+                target=_run_slack_worker, name="slack-notifier", daemon=True
+            )
+            _slack_worker.start()
+            # Registered on first use, after logging is configured, so the flush
+            # runs before the logging queue listener is stopped at exit
+            atexit.register(_flush_slack_notifications)
+
+    while True:
+        try:
+            _slack_queue.put_nowait((url, text))
+            return
+        except queue.Full:
+            try:
+                _slack_queue.get_nowait()
+                _slack_queue.task_done()
+                logger.warning("Slack notification queue full, dropped oldest message")
+            except queue.Empty:
+                pass
+
+
+@retry()
+def _send_email(message: EmailMessage, to_addrs: list[str]) -> None:
+    _smtp_pool.send_message(message, config.FROM_EMAIL, to_addrs)
+
+
 class AlertLevel(Enum):
     INFO = "ℹ️"
     WARNING = "⚠️"
@@ -29,7 +202,7 @@ def _create_slack_message(
     message: str,
     details: Optional[Dict[str, Any]] = None,
 ) -> str:
-    timestamp = pendulum.now("UTC").format("YYYY-MM-DD HH:mm:ss z")
+    timestamp = datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S %Z")
 
     formatted_message = [
         f"{level.value} *{level.name}*",
@@ -91,7 +264,7 @@ def send_failure_notification(
         )
         return
 
-    msg = MIMEMultipart("alternative")
+    msg = EmailMessage()
     msg["Subject"] = f"FileLoader Failed: {file_name} - {error_type}"
     msg["From"] = config.FROM_EMAIL
 
@@ -99,52 +272,38 @@ def send_failure_notification(
     if cc_recipients:
         msg["Cc"] = ", ".join(cc_recipients)
 
-    body_text = textwrap.dedent(f"""
-    File Processing Failure Notification
-
-    File: {file_name}
-    Error Type: {error_type}
-    Log ID: {log_id if log_id else "N/A"}
-
-    Error Details:
-    {error_message}
-    """).strip()
+    # Joined line by line so multi-line error messages don't defeat dedenting
+    body_lines = [
+        "File Processing Failure Notification",
+        "",
+        f"File: {file_name}",
+        f"Error Type: {error_type}",
+        f"Log ID: {log_id if log_id else 'N/A'}",
+        "",
+        "Error Details:",
+        error_message.strip(),
+    ]
 
     if additional_details:
-        body_text += f"\nAdditional Information:\n{additional_details}"
+        body_lines.extend(("Additional Information:", additional_details))
 
     if log_id:
-        body_text += f"\n\nData Team can reference log_id={log_id} for more details."
-
-    msg.attach(MIMEText(body_text, "plain"))
-
-    @retry()
-    def _send_email():
-        if not config.SMTP_HOST:
-            logger.warning("SMTP_HOST not configured, skipping email notification")
-            return
-
-        # Use SMTP_SSL for port 465, regular SMTP for other ports
-        if config.SMTP_PORT == 465:
-            server = smtplib.SMTP_SSL(config.SMTP_HOST, config.SMTP_PORT)
-        else:
-            server = smtplib.SMTP(config.SMTP_HOST, config.SMTP_PORT)
+        body_lines.extend(
+            ("", f"Data Team can reference log_id={log_id} for more details.")
+        )
 
-        with server:
-            if config.SMTP_USER and config.SMTP_PASSWORD:
-                # Only start TLS if not using SSL (port 465)
-                if config.SMTP_PORT != 465:
-                    server.starttls()
-                server.login(config.SMTP_USER, config.SMTP_PASSWORD)
+    msg.set_content("\n".join(body_lines))
 
-            all_recipients = recipients + cc_recipients
-            server.sendmail(config.FROM_EMAIL, all_recipients, msg.as_string())
-            logger.info(
-                f"Sent failure notification email for {file_name} to {len(all_recipients)} recipient(s)"
-            )
+    if not config.SMTP_HOST:
+        logger.warning("SMTP_HOST not configured, skipping email notification")
+        return
 
+    all_recipients = recipients + cc_recipients
     try:
-        _send_email()
+        _send_email(msg, all_recipients)
+        logger.info(
+            f"Sent failure notification email for {file_name} to {len(all_recipients)} recipient(s)"
+        )
     except Exception as e:
         logger.exception(
             f"Failed to send notification email for {file_name} after retries: {e}"
@@ -159,6 +318,9 @@ def send_slack_notification(
 ) -> None:
     """Send Slack notification for internal processing errors (code-based issues).
 
+    The message is queued and posted by a background thread; pending messages are
+    flushed at interpreter exit.
+
     Args:
         error_message: The error message or exception details
         file_name: Name of the file being processed (if applicable)
@@ -184,18 +346,4 @@ def send_slack_notification(
         details=details if details else None,
     )
 
-    @retry()
-    def _send_slack():
-        webhook = WebhookClient(config.SLACK_WEBHOOK_URL)
-        response = webhook.send(text=formatted_message)
-        if response.status_code == 200:
-            logger.info("Sent Slack notification for internal processing error")
-        else:
-            raise Exception(
-                f"Slack webhook returned status {response.status_code}: {response.body}"
-            )
-
-    try:
-        _send_slack()
-    except Exception as e:
-        logger.exception(f"Failed to send Slack notification after retries: {e}")
+    _enqueue_slack_message(config.SLACK_WEBHOOK_URL, formatted_message)
@@ -1,6 +1,6 @@
 import logging
 import os
-from pathlib import Path
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
 from src.file_processor import FileProcessor
 from src.readers.reader_factory import ReaderFactory
@@ -9,6 +9,59 @@ from src.settings import config
 logger = logging.getLogger(__name__)
 
 
+def _scan_directory(
+    path: str, extensions: tuple[str, ...], recursive: bool
+) -> tuple[list[str], list[str]]:
+    """Return supported files and (if recursive) subdirectories directly under path."""
+    file_paths = []
+    subdirectories = []
+
+    # Names are filtered first so the file-type check (a stat for symlinks or
+    # filesystems without d_type) only runs for candidate entries
+    with os.scandir(path) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.startswith("."):  # Skip hidden files and directories
+                continue
+            if name.lower().endswith(extensions) and entry.is_file():
+                file_paths.append(entry.path)
+            elif recursive and entry.is_dir(follow_symlinks=False):
+                # Symlinked directories aren't followed, which also rules out loops
+                subdirectories.append(entry.path)
+
+    return file_paths, subdirectories
+
+
+def _discover_files(directory: str, recursive: bool) -> list[str]:
+    extensions = ReaderFactory.get_supported_extensions()
+    if not recursive:
+        return _scan_directory(directory, extensions, recursive=False)[0]
+
+    # Archive and duplicate folders may live under the input directory
+    excluded = {
+        os.path.abspath(path)
+        for path in (config.ARCHIVE_PATH, config.DUPLICATE_FILES_PATH)
+    }
+    file_paths = []
+
+    # Directory listings are I/O bound (especially on network mounts), so scan
+    # subdirectories concurrently as they are found
+    with ThreadPoolExecutor(max_workers=config.IO_CONCURRENCY) as executor:
+        pending = {executor.submit(_scan_directory, directory, extensions, True)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                files, subdirectories = future.result()
+                file_paths.extend(files)
+                pending.update(
+                    executor.submit(_scan_directory, subdirectory, extensions, True)
+                    for subdirectory in subdirectories
+                    if os.path.abspath(subdirectory) not in excluded
+                )
+
+    return file_paths
+
+
 def process_directory() -> list[dict]:
     directory = config.DIRECTORY_PATH
 
@@ -19,23 +72,12 @@ def process_directory() -> list[dict]:
         raise ValueError(f"Path is not a directory: {directory}")
 
     # Use os.scandir() for faster file discovery
-    supported_extensions = set(ReaderFactory.get_supported_extensions())
-    files = []
-
-    for entry in os.scandir(directory):
-        if (
-            entry.is_file()
-            and not entry.name.startswith(".")  # Skip hidden files
-            and ReaderFactory._get_extension(Path(entry.path)) in supported_extensions
-        ):
-            files.append(Path(entry.path))
-
-    if not files:
+    file_paths = _discover_files(str(directory), config.RECURSIVE_DISCOVERY_FLAG)
+
+    if not file_paths:
         logger.warning(f"No files found in directory: {directory}")
         return []
 
     processor = FileProcessor()
 
-    file_paths = [str(f) for f in files]
-
     return processor.process_files_parallel(file_paths, config.ARCHIVE_PATH)
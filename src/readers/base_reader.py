@@ -1,12 +1,27 @@
 from abc import ABC, abstractmethod
+from functools import cache
 from pathlib import Path
-from typing import Any, Dict, Iterator
+from typing import Any, ClassVar, Dict, Iterator
+
+from pydantic import BaseModel
 
 from src.exceptions import MissingColumnsError
 from src.sources.base import DataSource
 
 
+@cache
+def _expected_fields(model: type[BaseModel]) -> frozenset[str]:
+    """Lowercased file column names (aliases or field names) a model requires."""
+    return frozenset(
+        field.alias.lower() if field.alias else name.lower()
+        for name, field in model.model_fields.items()
+    )
+
+
 class BaseReader(ABC):
+    # Source fields passed to the reader's constructor by ReaderFactory
+    READER_FIELDS: ClassVar[frozenset[str]] = frozenset()
+
     def __init__(self, file_path: Path, source: DataSource):
         self.file_path = file_path
         self.source = source
@@ -14,14 +29,12 @@ class BaseReader(ABC):
             raise FileNotFoundError(f"File not found: {self.file_path}")
         self.suffixes = self.file_path.suffixes
         self.is_gzipped = len(self.suffixes) >= 2 and self.suffixes[-1].lower() == ".gz"
+        self._expected_fields = _expected_fields(source.source_model)
 
     def _validate_fields(self, actual_fields: set[str]) -> None:
         actual_fields_lowered = set[str](field.lower() for field in actual_fields)
         # Check that all model fields exist as columns in the file (both required and optional)
-        expected_fields = set[str](
-            field.alias.lower() if field.alias else name.lower()
-            for name, field in self.source.source_model.model_fields.items()
-        )
+        expected_fields = self._expected_fields
         missing_fields = expected_fields - actual_fields_lowered
 
         if missing_fields:
@@ -1,5 +1,9 @@
 import csv
 import gzip
+import io
+import os
+import sys
+from itertools import islice
 from pathlib import Path
 from typing import Any, Dict, Iterator
 
@@ -7,52 +11,128 @@ from src.exceptions import MissingHeaderError
 from src.readers.base_reader import BaseReader
 from src.sources.base import CSVSource
 
+READ_BUFFER_SIZE = 1 << 20
+
 
 class CSVReader(BaseReader):
+    READER_FIELDS = frozenset({"delimiter", "encoding", "skip_rows", "use_pyarrow"})
+
     def __init__(
-        self, file_path: Path, source, delimiter: str, encoding: str, skip_rows: int
+        self,
+        file_path: Path,
+        source,
+        delimiter: str,
+        encoding: str,
+        skip_rows: int,
+        use_pyarrow: bool = False,
     ):
         super().__init__(file_path, source)
         self.delimiter = delimiter
         self.encoding = encoding
         self.skip_rows = skip_rows
+        self.use_pyarrow = use_pyarrow
 
     @property
     def starting_row_number(self) -> int:
         """CSV: Row 1 = header, so starting row = 2 + skip_rows."""
         return 2 + self.skip_rows
 
+    def _open(self) -> io.TextIOWrapper:
+        # Read through a large binary buffer so the csv parser isn't fed by many
+        # small read() calls on big files
+        if self.is_gzipped:
+            raw = io.BufferedReader(
+                gzip.open(self.file_path, "rb"), buffer_size=READ_BUFFER_SIZE
+            )
+        else:
+            raw = open(self.file_path, "rb", buffering=READ_BUFFER_SIZE)
+            if hasattr(os, "posix_fadvise"):
+                # Hint the kernel to read ahead aggressively (Linux/Unix only)
+                os.posix_fadvise(raw.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        try:
+            return io.TextIOWrapper(raw, encoding=self.encoding, newline="")
+        except Exception:
+            raw.close()
+            raise
+
+    def _validate_headers(self, fieldnames: list[str] | None) -> None:
+        # Check if headers exist
+        if not fieldnames:
+            raise MissingHeaderError(f"No headers found in CSV file: {self.file_path}")
+
+        # Check if headers are just whitespace
+        if not any(fieldname and fieldname.strip() for fieldname in fieldnames):
+            raise MissingHeaderError(
+                f"Whitespace-only headers in CSV file: {self.file_path}"
+            )
+
+        self._validate_fields(set[str](fieldnames))
+
+    def read_batches(self) -> Iterator[Any]:
+        """Stream the file as PyArrow RecordBatches using its multithreaded C++ parser.
+
+        Every column is read as a string, as csv.DictReader would, so values such as
+        leading-zero codes reach validation unchanged. Requires pyarrow to be installed.
+        """
+        try:
+            import pyarrow
+            from pyarrow import csv as pyarrow_csv
+        except ImportError as e:
+            raise ImportError(
+                f"pyarrow is required for CSV sources with use_pyarrow=True: {e}"
+            ) from e
+
+        with self._open() as csvfile:
+            fieldnames = next(csv.reader(csvfile, delimiter=self.delimiter), None)
+        self._validate_headers(fieldnames)
+
+        read_options = pyarrow_csv.ReadOptions(
+            encoding=self.encoding,
+            block_size=8 << 20,
+            skip_rows_after_names=self.skip_rows,
+        )
+        parse_options = pyarrow_csv.ParseOptions(
+            delimiter=self.delimiter, newlines_in_values=True
+        )
+        convert_options = pyarrow_csv.ConvertOptions(
+            column_types={name: pyarrow.string() for name in fieldnames},
+            strings_can_be_null=False,
+            quoted_strings_can_be_null=False,
+        )
+        # pyarrow decompresses .gz paths itself
+        with pyarrow_csv.open_csv(
+            str(self.file_path),
+            read_options=read_options,
+            parse_options=parse_options,
+            convert_options=convert_options,
+        ) as batches:
+            yield from batches
+
     def read(self) -> Iterator[Dict[str, Any]]:
-        # Use gzip.open() if file is gzipped, otherwise regular open()
-        file_opener = gzip.open if self.is_gzipped else open
-        file_mode = "rt" if self.is_gzipped else "r"
-
-        with file_opener(
-            self.file_path, file_mode, encoding=self.encoding, newline=""
-        ) as csvfile:
-            reader = csv.DictReader(csvfile, delimiter=self.delimiter)
-
-            # Check if headers exist
-            if not reader.fieldnames:
-                raise MissingHeaderError(
-                    f"No headers found in CSV file: {self.file_path}"
-                )
-
-            # Check if headers are just whitespace
-            if not any(
-                fieldname and fieldname.strip() for fieldname in reader.fieldnames
-            ):
-                raise MissingHeaderError(
-                    f"Whitespace-only headers in CSV file: {self.file_path}"
-                )
-
-            actual_headers = set[str](reader.fieldnames)
-            self._validate_fields(actual_headers)
-
-            for i, row in enumerate(reader):
-                if i < self.skip_rows:
-                    continue
-                yield row
+        if self.use_pyarrow:
+            for batch in self.read_batches():
+                yield from batch.to_pylist()
+            return
+
+        with self._open() as csvfile:
+            # csv.reader with one interned header tuple avoids DictReader's per-row
+            # Python overhead; blank lines and ragged rows are handled as it would
+            reader = csv.reader(csvfile, delimiter=self.delimiter)
+            fieldnames = next(reader, None)
+            self._validate_headers(fieldnames)
+
+            headers = tuple(map(sys.intern, fieldnames))
+            width = len(headers)
+            rows = (row for row in reader if row)
+            for row in islice(rows, self.skip_rows, None):
+                record = dict(zip(headers, row))
+                if len(row) != width:
+                    if len(row) > width:
+                        record[None] = row[width:]
+                    else:
+                        for header in headers[len(row) :]:
+                            record[header] = None
+                yield record
 
     @classmethod
     def matches_source_type(cls, source_type) -> bool:
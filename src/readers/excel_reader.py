@@ -1,24 +1,84 @@
+import itertools
+import re
+from datetime import UTC, datetime, timedelta
+from functools import cache
 from pathlib import Path
 from typing import Any, Dict, Iterator, get_args, get_origin
 
 import pendulum
-import pyexcel
+from pydantic import BaseModel
 from pydantic_extra_types.pendulum_dt import Date, DateTime
 
 from src.exceptions import MissingHeaderError
 from src.readers.base_reader import BaseReader
 from src.sources.base import ExcelSource
 
+# Excel epoch: 1899-12-30 (Excel's epoch with 1900 leap year bug)
+# Serial number 1 = 1900-01-01
+_EXCEL_EPOCH = datetime(1899, 12, 30, tzinfo=UTC)
+
+# pyexcel names header-less columns '', '-1', '-2', ...
+_DEFAULT_HEADER_NAME = re.compile(r"-*\d+")
+
+
+def _serial_to_date(
+    value: int | float, field_type: type
+) -> pendulum.Date | pendulum.DateTime:
+    """Convert an Excel serial date number to a pendulum Date or UTC DateTime.
+
+    Excel stores dates as serial numbers (days since 1899-12-30, because Excel
+    incorrectly treats 1900 as a leap year). The fractional part is the time of day.
+    """
+    days = int(value)
+    fractional = value - days
+    # Add time component if there's a fractional part (time of day)
+    seconds = int(fractional * 86400) if fractional > 0 else 0
+    dt = _EXCEL_EPOCH + timedelta(days=days, seconds=seconds)
+    # Build pendulum values from the stdlib result; pendulum's own arithmetic is slower
+    if field_type is Date:
+        return pendulum.Date(dt.year, dt.month, dt.day)
+    return pendulum.DateTime(
+        dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second, tzinfo=pendulum.UTC
+    )
+
+
+@cache
+def _date_field_mapping(model: type[BaseModel]) -> Dict[str, type]:
+    """Lowercased field names and aliases of a model's Date/DateTime fields.
+
+    Built once per model and shared across files; callers must not mutate it.
+    """
+    date_field_mapping = {}
+    for field_name, field_info in model.model_fields.items():
+        field_type = field_info.annotation
+        origin = get_origin(field_type)
+        if origin is not None:  # It's Optional or Union
+            args = get_args(field_type)
+            field_type = args[0] if args else field_type
+
+        if field_type in (Date, DateTime):
+            # Map both the field name and alias (if exists) to the field type
+            date_field_mapping[field_name.lower()] = field_type
+            if field_info.alias:
+                date_field_mapping[field_info.alias.lower()] = field_type
+    return date_field_mapping
 
-class ExcelReader(BaseReader):
-    # Excel epoch: 1899-12-30 (Excel's epoch with 1900 leap year bug)
-    # Serial number 1 = 1900-01-01
-    _EXCEL_EPOCH = pendulum.datetime(1899, 12, 30)
 
-    def __init__(self, file_path: Path, source, sheet_name: str, skip_rows: int):
+class ExcelReader(BaseReader):
+    READER_FIELDS = frozenset({"sheet_name", "skip_rows", "use_calamine"})
+
+    def __init__(
+        self,
+        file_path: Path,
+        source,
+        sheet_name: str,
+        skip_rows: int,
+        use_calamine: bool = False,
+    ):
         super().__init__(file_path, source)
         self.sheet_name = sheet_name
         self.skip_rows = skip_rows
+        self.use_calamine = use_calamine
 
     @property
     def starting_row_number(self) -> int:
@@ -27,61 +87,46 @@ class ExcelReader(BaseReader):
 
     def _build_date_field_mapping(self) -> Dict[str, type]:
         """Build mapping of column names (aliases) to Date/DateTime field types."""
-        date_field_mapping = {}
-        for field_name, field_info in self.source.source_model.model_fields.items():
-            field_type = field_info.annotation
-            origin = get_origin(field_type)
-            if origin is not None:  # It's Optional or Union
-                args = get_args(field_type)
-                field_type = args[0] if args else field_type
-
-            if field_type in (Date, DateTime):
-                # Map both the field name and alias (if exists) to the field type
-                date_field_mapping[field_name.lower()] = field_type
-                if field_info.alias:
-                    date_field_mapping[field_info.alias.lower()] = field_type
-        return date_field_mapping
-
-    def _convert_excel_dates(
-        self, record: Dict[str, Any], date_field_mapping: Dict[str, type]
-    ) -> Dict[str, Any]:
-        """Convert Excel serial date numbers to datetime objects in the record.
-
-        Excel stores dates as serial numbers (days since 1899-12-30, because Excel
-        incorrectly treats 1900 as a leap year). Serial number 1 = 1900-01-01.
-
-        Only converts numeric values in fields that are Date or DateTime in the source model.
+        return _date_field_mapping(self.source.source_model)
+
+    def _iter_calamine_records(self) -> Iterator[Dict[str, Any]]:
+        """Yield rows keyed by the header row using the Rust-backed calamine parser.
+
+        Requires python-calamine to be installed. Date-formatted cells come back as
+        native date/datetime objects, so only numeric serials still need converting.
         """
-        converted = {}
-        for key, value in record.items():
-            key_lower = key.lower()
-            # Only convert if the field is Date/DateTime in the source model AND value is numeric
-            if key_lower in date_field_mapping and isinstance(value, (int, float)):
-                days = int(value)
-                fractional = value - days
-
-                # Convert to datetime using pendulum's add() method
-                dt = self._EXCEL_EPOCH.add(days=days)
-
-                # Add time component if there's a fractional part (time of day)
-                if fractional > 0:
-                    seconds = int(fractional * 86400)  # 86400 seconds in a day
-                    dt = dt.add(seconds=seconds)
-
-                if date_field_mapping[key_lower] == Date:
-                    converted[key] = dt.date()
-                else:
-                    converted[key] = dt
-            else:
-                converted[key] = value
-        return converted
+        try:
+            from python_calamine import CalamineWorkbook
+        except ImportError as e:
+            raise ImportError(
+                f"python-calamine is required for Excel sources with use_calamine=True: {e}"
+            ) from e
+
+        workbook = CalamineWorkbook.from_path(str(self.file_path))
+        sheet = (
+            workbook.get_sheet_by_name(self.sheet_name)
+            if self.sheet_name
+            else workbook.get_sheet_by_index(0)
+        )
+        rows = iter(sheet.iter_rows())
+        headers = next(rows, None)
+        if headers is None:
+            return
+        for row in rows:
+            yield dict(zip(headers, row))
 
     def read(self) -> Iterator[Dict[str, Any]]:
-        records = pyexcel.iget_records(
-            file_name=str(self.file_path),
-            sheet_name=self.sheet_name,
-            name_columns_by_row=0,
-        )
+        if self.use_calamine:
+            records = self._iter_calamine_records()
+        else:
+            # Deferred: pyexcel and its plugins are slow to import and only needed here
+            import pyexcel
+
+            records = pyexcel.iget_records(
+                file_name=str(self.file_path),
+                sheet_name=self.sheet_name,
+                name_columns_by_row=0,
+            )
 
         try:
             first_record = next(records)
@@ -91,36 +136,51 @@ class ExcelReader(BaseReader):
         actual_headers = set(first_record.keys())
 
         # Check if headers are empty/whitespace OR all look like default pyexcel column names (e.g., '', '-1', '-2')
-        # These are created when headers are missing or empty
-        no_valid_headers = not any(
-            isinstance(key, str) and key.strip() for key in actual_headers
-        )
-        all_default_names = len(actual_headers) > 0 and all(
-            (
-                not key
-                or not str(key).strip()
-                or (isinstance(key, str) and str(key).strip().lstrip("-").isdigit())
-            )
-            for key in actual_headers
-        )
-
-        if no_valid_headers or all_default_names:
+        # These are created when headers are missing or empty. One pass counts both.
+        valid_headers = 0
+        default_names = 0
+        for key in actual_headers:
+            if isinstance(key, str):
+                stripped = key.strip()
+                if not stripped:
+                    default_names += 1
+                    continue
+                valid_headers += 1
+                if _DEFAULT_HEADER_NAME.fullmatch(stripped):
+                    default_names += 1
+            elif not key or not str(key).strip():
+                default_names += 1
+
+        if valid_headers == 0 or default_names == len(actual_headers):
             raise MissingHeaderError(
                 f"Empty or invalid column headers in Excel file: {self.file_path}"
             )
 
         self._validate_fields(actual_headers)
 
-        # Build mapping of column names (aliases) to field types for date conversion
+        # Resolve the file's date columns once so rows only touch those cells
         date_field_mapping = self._build_date_field_mapping()
-
-        if self.skip_rows <= 0:
-            yield self._convert_excel_dates(first_record, date_field_mapping)
-
-        for i, record in enumerate(records, start=1):
-            if i < self.skip_rows:
-                continue
-            yield self._convert_excel_dates(record, date_field_mapping)
+        date_columns = [
+            (header, date_field_mapping[header.lower()])
+            for header in first_record
+            if isinstance(header, str) and header.lower() in date_field_mapping
+        ]
+
+        records = itertools.islice(
+            itertools.chain((first_record,), records), self.skip_rows, None
+        )
+        if not date_columns:
+            # Nothing to convert: hand rows through without a per-row loop
+            yield from records
+            return
+
+        for record in records:
+            # Only numeric values in Date/DateTime fields are Excel serial dates
+            for column, field_type in date_columns:
+                value = record.get(column)
+                if type(value) in (int, float):
+                    record[column] = _serial_to_date(value, field_type)
+            yield record
 
     @classmethod
     def matches_source_type(cls, source_type) -> bool:
@@ -1,15 +1,21 @@
 import gzip
-from decimal import Decimal
+import mmap
+from contextlib import contextmanager
+from itertools import islice
 from pathlib import Path
 from typing import Any, Dict, Iterator
 
-import ijson
-
 from src.readers.base_reader import BaseReader
 from src.sources.base import JSONSource
 
+# Uncompressed files at least this large are memory-mapped; smaller files aren't
+# worth the mapping setup cost over buffered reads
+MMAP_MIN_BYTES = 16 * 1024 * 1024
+
 
 class JSONReader(BaseReader):
+    READER_FIELDS = frozenset({"array_path", "skip_rows"})
+
     def __init__(self, file_path: Path, source, array_path: str, skip_rows: int):
         super().__init__(file_path, source)
         self.array_path = array_path
@@ -20,11 +26,18 @@ class JSONReader(BaseReader):
         """JSON: No header, so starting row = 1 + skip_rows."""
         return 1 + self.skip_rows
 
-    def _convert_decimals_to_float(self, value: Any) -> Any:
-        """Convert Decimal values to float for database compatibility."""
-        if isinstance(value, Decimal):
-            return float(value)
-        return value
+    @contextmanager
+    def _open(self):
+        if self.is_gzipped:
+            with gzip.open(self.file_path, "rb") as file:
+                yield file
+            return
+        with open(self.file_path, "rb") as file:
+            if self.file_path.stat().st_size < MMAP_MIN_BYTES:
+                yield file
+                return
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield mapped
 
     def read(self) -> Iterator[Dict[str, Any]]:
         """Read JSON file iteratively.
@@ -33,11 +46,12 @@ class JSONReader(BaseReader):
         Flattening preserves JSON key structure (e.g., nested {"Entry": {"ID": 1}}
         becomes "Entry_ID"), so JSON structure should align with model expectations.
         """
-        # Use gzip.open() if file is gzipped, otherwise regular open()
-        file_opener = gzip.open if self.is_gzipped else open
+        import ijson
 
-        with file_opener(self.file_path, "rb") as file:
-            objects = ijson.items(file, self.array_path)
+        with self._open() as file:
+            # ijson already picks the yajl2_c backend when available; use_float makes
+            # it emit floats directly instead of Decimals that need converting later
+            objects = ijson.items(file, self.array_path, use_float=True)
 
             try:
                 first_obj = next(objects)
@@ -53,9 +67,7 @@ class JSONReader(BaseReader):
                 self._validate_fields(actual_fields)
 
                 # Yield list elements respecting skip_rows
-                for idx, item in enumerate(first_obj):
-                    if idx < self.skip_rows:
-                        continue
+                for item in islice(first_obj, self.skip_rows, None):
                     yield self._flatten_dict(item)
 
                 # Continue streaming remaining items; if any are lists, emit all
@@ -76,9 +88,8 @@ class JSONReader(BaseReader):
             if self.skip_rows <= 0:
                 yield flattened_first
 
-            for i, obj in enumerate(objects, start=1):
-                if i < self.skip_rows:
-                    continue
+            # The first object counts towards skip_rows
+            for obj in islice(objects, max(self.skip_rows - 1, 0), None):
                 # If stream yields a list, emit all items
                 if isinstance(obj, list):
                     for item in obj:
@@ -89,34 +100,31 @@ class JSONReader(BaseReader):
     def _flatten_dict(
         self, dictionary: Dict[str, Any], parent_key: str = "", sep: str = "_"
     ) -> Dict[str, Any]:
-        items = []
-        for k, v in dictionary.items():
-            new_key = f"{parent_key}{sep}{k}".lower() if parent_key else k.lower()
-            if isinstance(v, dict):
-                items.extend(self._flatten_dict(v, new_key, sep=sep).items())
-            elif isinstance(v, list):
-                # Handle lists by converting to string or flattening if they contain dicts
-                if v and isinstance(v[0], dict):
-                    # If list contains dicts, flatten each dict with index
-                    for i, item in enumerate(v):
-                        if isinstance(item, dict):
-                            items.extend(
-                                self._flatten_dict(
-                                    item, f"{new_key}{sep}{i}".lower(), sep=sep
-                                ).items()
-                            )
-                        else:
-                            items.append(
-                                (
-                                    f"{new_key}{sep}{i}".lower(),
-                                    self._convert_decimals_to_float(item),
-                                )
-                            )
+        # Walk nested dicts with an explicit stack of iterators instead of recursion
+        # so deep records don't pay per-level frame and intermediate-dict overhead.
+        # Each frame is (items iterator, key prefix, whether it iterates a list of dicts).
+        out = {}
+        stack = [(iter(dictionary.items()), parent_key.lower(), False)]
+        while stack:
+            items, prefix, in_list = stack[-1]
+            for k, v in items:
+                new_key = (
+                    f"{prefix}{sep}{k}".lower() if prefix or in_list else k.lower()
+                )
+                if type(v) is dict:
+                    stack.append((iter(v.items()), new_key, False))
+                    break
+                if type(v) is list and not in_list:
+                    # Lists of dicts are flattened with an index, other lists are stringified
+                    if v and type(v[0]) is dict:
+                        stack.append((enumerate(v), new_key, True))
+                        break
+                    out[new_key] = str(v)
                 else:
-                    items.append((new_key, str(self._convert_decimals_to_float(v))))
+                    out[new_key] = v
             else:
-                items.append((new_key, self._convert_decimals_to_float(v)))
-        return dict(items)
+                stack.pop()
+        return out
 
     @classmethod
     def matches_source_type(cls, source_type) -> bool:
@@ -1,3 +1,4 @@
+from functools import cache, lru_cache
 from pathlib import Path
 
 from src.readers.base_reader import BaseReader
@@ -20,14 +21,7 @@ class ReaderFactory:
     @classmethod
     def _get_extension(cls, file_path: Path) -> str:
         """Get the file extension, checking for compressed variants first."""
-        suffixes = file_path.suffixes
-        # Check for compressed extension first (e.g., .csv.gz)
-        if len(suffixes) >= 2:
-            combined = "".join(suffixes[-2:]).lower()
-            if combined in cls._readers:
-                return combined
-        # Fall back to single extension
-        return file_path.suffix.lower()
+        return _resolve_extension(tuple(file_path.suffixes))
 
     @classmethod
     def create_reader(cls, file_path: Path, source: DataSource, **kwargs) -> BaseReader:
@@ -47,14 +41,28 @@ class ReaderFactory:
                 f"File extension {extension} expects {reader_class.__name__} source, got {type(source).__name__}"
             )
 
-        # Extract reader-specific config from source
-        reader_kwargs = source.model_dump(
-            include={"delimiter", "encoding", "skip_rows", "sheet_name", "array_path"}
-        )
+        # Extract reader-specific config from source (plain attribute reads; the
+        # source type check above guarantees the fields exist)
+        reader_kwargs = {
+            name: getattr(source, name) for name in reader_class.READER_FIELDS
+        }
         reader_kwargs.update(kwargs)  # Allow override of any kwargs
 
         return reader_class(file_path, source, **reader_kwargs)
 
     @classmethod
-    def get_supported_extensions(cls) -> list[str]:
-        return list[str](cls._readers.keys())
+    @cache
+    def get_supported_extensions(cls) -> tuple[str, ...]:
+        return tuple(cls._readers.keys())
+
+
+@lru_cache(maxsize=1024)
+def _resolve_extension(suffixes: tuple[str, ...]) -> str:
+    """Map a file's suffixes to a ReaderFactory extension key (memoized)."""
+    # Check for compressed extension first (e.g., .csv.gz)
+    if len(suffixes) >= 2:
+        combined = "".join(suffixes[-2:]).lower()
+        if combined in ReaderFactory._readers:
+            return combined
+    # Fall back to single extension
+    return suffixes[-1].lower() if suffixes else ""
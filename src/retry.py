@@ -4,31 +4,36 @@ import time
 from functools import wraps
 from typing import Optional
 
-from src.exceptions import FILE_ERROR_EXCEPTIONS
+from src.exceptions import FILE_ERROR_EXCEPTION_TYPES
 
 logger = logging.getLogger(__name__)
 
 
 def retry(attempts: int = 3, delay: float = 0.25, backoff: float = 2.0):
     def decorator(fn):
+        if attempts <= 1:
+            # Nothing to retry; avoid the wrapper call entirely
+            return fn
+
+        # Backoff schedule is fixed per decorated function, so compute it once
+        waits = tuple(delay * backoff**i for i in range(attempts - 1))
+
         @wraps(fn)
         def wrapper(*args, **kwargs):
-            wait = delay
-            for i in range(attempts):
+            for attempt, wait in enumerate(waits, start=2):
                 try:
                     return fn(*args, **kwargs)
                 except Exception as e:
                     # Don't retry file-specific validation errors
-                    if type(e) in FILE_ERROR_EXCEPTIONS:
+                    if isinstance(e, FILE_ERROR_EXCEPTION_TYPES):
                         raise e
 
-                    if i == attempts - 1:
-                        raise e
                     logger.warning(
-                        f"Retrying {fn.__name__} (attempt {i + 2}/{attempts}) after {type(e).__name__}: {e}"
+                        f"Retrying {fn.__name__} (attempt {attempt}/{attempts}) after {type(e).__name__}: {e}"
                     )
                     time.sleep(wait)
-                    wait *= backoff
+            # Last attempt propagates its exception as-is
+            return fn(*args, **kwargs)
 
         return wrapper
 
@@ -4,7 +4,7 @@ from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-from pydantic import field_validator
+from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pythonnet import load
 
@@ -17,6 +17,15 @@ SUPPORTED_DATABASE_DRIVERS = {
 }
 
 
+@lru_cache()
+def _drivername(database_url: str) -> str:
+    # Keyed on the URL so reassigning DATABASE_URL (as tests do) is still honoured
+    for drivername, dialect in SUPPORTED_DATABASE_DRIVERS.items():
+        if drivername in database_url.lower():
+            return dialect.lower()
+    raise ValueError(f"Unsupported database driver in DATABASE_URL: {database_url}")
+
+
 class BaseConfig(BaseSettings):
     ENV_STATE: Optional[str] = None
 
@@ -31,15 +40,15 @@ class GlobalConfig(BaseConfig):
 
     BATCH_SIZE: int = 10000
     LOG_LEVEL: str = "INFO"
+    # Files are I/O bound (copies and database round trips), so size the pool to
+    # in-flight I/O rather than cores
+    IO_CONCURRENCY: int = Field(
+        default_factory=lambda: min(32, (os.cpu_count() or 1) * 2)
+    )
 
     @property
     def DRIVERNAME(self) -> str:
-        for drivername, dialect in SUPPORTED_DATABASE_DRIVERS.items():
-            if drivername in self.DATABASE_URL.lower():
-                return dialect.lower()
-        raise ValueError(
-            f"Unsupported database driver in DATABASE_URL: {self.DATABASE_URL}"
-        )
+        return _drivername(self.DATABASE_URL)
 
     # Email notification settings
     SMTP_HOST: Optional[str] = None
@@ -66,6 +75,12 @@ class GlobalConfig(BaseConfig):
     OPEN_TELEMETRY_AUTHORIZATION_TOKEN: Optional[str] = None
 
     SQL_SERVER_SQLBULKCOPY_FLAG: bool = False
+    # Run files in worker processes instead of threads; parsing, validation and
+    # hashing hold the GIL, so this scales CPU-heavy runs across cores
+    PROCESS_POOL_FLAG: bool = False
+    # Also pick up files in subdirectories of DIRECTORY_PATH (hidden directories,
+    # symlinked directories and the archive/duplicate folders are skipped)
+    RECURSIVE_DISCOVERY_FLAG: bool = False
 
 
 class DevConfig(GlobalConfig):
@@ -125,8 +140,9 @@ _initialize_dotnet_runtime()
 
 
 def get_database_config():
-    env_state = BaseConfig().ENV_STATE
-    db_config = get_config(env_state)
+    # The module-level config is the same cached instance get_config() returns, so
+    # reuse it rather than re-reading .env through a fresh BaseConfig
+    db_config = config
 
     is_sqlite = db_config.DATABASE_URL.startswith("sqlite")
 
@@ -144,4 +160,8 @@ def get_database_config():
         config_dict["sqlalchemy.max_overflow"] = 10
         config_dict["sqlalchemy.pool_timeout"] = 30
 
+    if db_config.DATABASE_URL.startswith("mssql+pyodbc"):
+        # Send executemany batches as a single parameter array instead of a round trip per row
+        config_dict["sqlalchemy.fast_executemany"] = True
+
     return config_dict
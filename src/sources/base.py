@@ -1,3 +1,8 @@
+import fnmatch
+import os
+import re
+from datetime import date
+from functools import cache, cached_property
 from pathlib import Path
 from typing import Optional, Type
 
@@ -39,6 +44,26 @@ class TableModel(BaseModel):
     model_config = ConfigDict(validate_by_name=True, validate_by_alias=True)
 
 
+def parse_iso_date(v):
+    """Parse ISO date strings with the C date parser ahead of pendulum's parser.
+
+    Use as a before field_validator on pendulum Date fields; anything that isn't
+    an ISO date is passed through for pendulum to handle. DateTime fields don't
+    need it: their validator already tries pydantic-core's parser before pendulum's.
+    """
+    if type(v) is not str:
+        return v
+    try:
+        return date.fromisoformat(v)
+    except ValueError:
+        return v
+
+
+@cache
+def _model_field_names(model: type[TableModel]) -> frozenset[str]:
+    return frozenset(model.model_fields)
+
+
 class DataSource(BaseModel):
     file_pattern: str
     source_model: Type[TableModel]
@@ -49,11 +74,13 @@ class DataSource(BaseModel):
     notification_emails: Optional[list[str]] = Field(
         default=None
     )  # List of email addresses to notify on failures
+    # Upsert straight into the target table, skipping the stage table, audit and MERGE
+    direct_upsert: bool = Field(default=False)
 
     @model_validator(mode="after")
     def validate_grain_fields(self):
         """Validate that all grain columns are fields in the source model."""
-        model_fields = set(self.source_model.model_fields.keys())
+        model_fields = _model_field_names(self.source_model)
         invalid_grain = [g for g in self.grain if g not in model_fields]
         if invalid_grain:
             raise ValueError(
@@ -62,19 +89,43 @@ class DataSource(BaseModel):
             )
         return self
 
+    @model_validator(mode="after")
+    def validate_direct_upsert(self):
+        """Audit queries run against the stage table, which direct_upsert skips."""
+        if self.direct_upsert and self.audit_query is not None:
+            raise ValueError(
+                f"Source {self.table_name} sets direct_upsert, which skips the stage table, so it cannot use an audit_query"
+            )
+        return self
+
+    @cached_property
+    def _file_name_regex(self) -> Optional[re.Pattern[str]]:
+        """Compiled file_pattern when it only matches the file name (no directories)."""
+        pattern = self.file_pattern.lower()
+        if "/" in pattern or os.sep in pattern:
+            return None
+        return re.compile(fnmatch.translate(pattern))
+
     def matches_file(self, file_path: str) -> bool:
-        return Path(file_path.lower()).match(self.file_pattern.lower())
+        file_name_regex = self._file_name_regex
+        if file_name_regex is None:
+            return Path(file_path.lower()).match(self.file_pattern.lower())
+        return file_name_regex.match(os.path.basename(file_path).lower()) is not None
 
 
 class CSVSource(DataSource):
     delimiter: str = Field(default=",")
     encoding: str = Field(default="utf-8")
     skip_rows: int = Field(default=0)
+    # Parse with PyArrow's streaming C++ reader (pyarrow must be installed)
+    use_pyarrow: bool = Field(default=False)
 
 
 class ExcelSource(DataSource):
     sheet_name: Optional[str] = None
     skip_rows: int = Field(default=0)
+    # Parse with the Rust-backed calamine reader (python-calamine must be installed)
+    use_calamine: bool = Field(default=False)
 
 
 class JSONSource(DataSource):
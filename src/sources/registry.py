@@ -11,10 +11,16 @@ class SourceRegistry(BaseModel):
     def add_sources(self, sources: list[DataSource]) -> None:
         self.sources.extend(sources)
 
+    def _matching_sources(self, file_path: str) -> list[DataSource]:
+        return [source for source in self.sources if source.matches_file(file_path)]
+
     def find_source_for_file(self, file_path: str) -> Optional[DataSource]:
-        matching_sources = [
-            source for source in self.sources if source.matches_file(file_path)
-        ]
+        matching_sources = self._matching_sources(file_path)
+
+        # Gzipped files (e.g. sales_2024.csv.gz) belong to the source whose pattern
+        # matches the uncompressed name (sales_*.csv)
+        if not matching_sources and file_path.lower().endswith(".gz"):
+            matching_sources = self._matching_sources(file_path[:-3])
 
         if len(matching_sources) == 0:
             return None
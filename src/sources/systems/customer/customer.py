@@ -3,7 +3,7 @@ import re
 from pydantic import EmailStr, Field, field_validator
 from pydantic_extra_types.pendulum_dt import Date
 
-from src.sources.base import CSVSource, TableModel
+from src.sources.base import CSVSource, TableModel, parse_iso_date
 
 # Cache compiled regex patterns for performance
 _PHONE_CLEAN_PATTERN = re.compile(r"[^\d+]")
@@ -40,6 +40,11 @@ class Customer(TableModel):
             return v
         return v.strip().lower()
 
+    @field_validator("subscription_date", mode="before")
+    @classmethod
+    def parse_subscription_date(cls, v):
+        return parse_iso_date(v)
+
 
 CUSTOMERS = CSVSource(
     file_pattern="customers-*.csv",
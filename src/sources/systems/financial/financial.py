@@ -1,9 +1,9 @@
 from typing import Optional
 
-from pydantic import Field
+from pydantic import Field, field_validator
 from pydantic_extra_types.pendulum_dt import Date
 
-from src.sources.base import JSONSource, TableModel
+from src.sources.base import JSONSource, TableModel, parse_iso_date
 
 
 class LedgerEntry(TableModel):
@@ -16,6 +16,11 @@ class LedgerEntry(TableModel):
     transaction_date: Date
     reference_number: str = Field(max_length=100)
 
+    @field_validator("transaction_date", mode="before")
+    @classmethod
+    def parse_transaction_date(cls, v):
+        return parse_iso_date(v)
+
 
 FINANCIAL = JSONSource(
     file_pattern="ledger_*.json",
@@ -1,7 +1,7 @@
-from pydantic import Field
+from pydantic import Field, field_validator
 from pydantic_extra_types.pendulum_dt import Date
 
-from src.sources.base import CSVSource, TableModel
+from src.sources.base import CSVSource, TableModel, parse_iso_date
 
 
 class Transaction(TableModel):
@@ -14,6 +14,11 @@ class Transaction(TableModel):
     sale_date: Date
     sales_rep: str = Field(max_length=100)
 
+    @field_validator("sale_date", mode="before")
+    @classmethod
+    def parse_sale_date(cls, v):
+        return parse_iso_date(v)
+
 
 SALES = CSVSource(
     file_pattern="sales_*.csv",
@@ -2,6 +2,8 @@ import logging
 import platform
 import socket
 import sys
+import time
+from functools import lru_cache
 from pathlib import Path
 from urllib.parse import parse_qs, unquote, urlparse
 
@@ -41,8 +43,13 @@ def get_runtime() -> str:
         return "unknown"
 
 
+@lru_cache(maxsize=1)
 def _ensure_clr_available():
-    """Lazily import pythonnet/.NET components, raising a clear error if unavailable."""
+    """Lazily import pythonnet/.NET components, raising a clear error if unavailable.
+
+    Cached so assembly references and the DLL path are only added once per process;
+    failures aren't cached, so a later call tries again.
+    """
     try:
         # Runtime should already be loaded in settings.py at startup
         import clr
@@ -84,49 +91,91 @@ def _ensure_clr_available():
         raise
 
 
-def dicts_to_datatable(data: list[dict], table_name: str):
-    """Convert list of dicts to .NET DataTable."""
-    DataTable, DBNull, _, _, _ = _ensure_clr_available()
-    import System  # type: ignore[import-untyped]
+@lru_cache(maxsize=1)
+def _get_typed_columns() -> dict:
+    """CLR types for columns that need an explicit .NET type, resolved once.
 
-    dt = DataTable()
+    Maps column name to the DataColumn type, which also converts the Python value.
+    """
+    _ensure_clr_available()
+    import System  # type: ignore[import-untyped]
 
-    column_types = {
+    return {
+        # etl_row_hash: Python bytes become a .NET byte array
         "etl_row_hash": System.Array[System.Byte],
         "file_load_log_id": System.Int64,
         "file_row_number": System.Int32,
     }
 
-    for col in data[0].keys():
+
+@lru_cache(maxsize=32)
+def _get_datatable_template(table_name: str, columns: tuple[str, ...]):
+    """Empty DataTable with the table's column schema, built once and cloned per batch."""
+    DataTable, _, _, _, _ = _ensure_clr_available()
+    import System  # type: ignore[import-untyped]
+
+    dt = DataTable()
+    column_types = _get_typed_columns()
+
+    for col in columns:
         if col in column_types:
             column = System.Data.DataColumn(col, column_types[col])
             dt.Columns.Add(column)
         else:
             dt.Columns.Add(col)
-
-    for row in data:
-        dr = dt.NewRow()
-        for key, value in row.items():
-            if value is None:
-                dr[key] = DBNull.Value
-            elif key in column_types:
-                col_type = column_types[key]
-                if col_type == System.Array[System.Byte]:
-                    # etl_row_hash: convert Python bytes to .NET byte array
-                    dr[key] = System.Array[System.Byte](value)
-                elif col_type == System.Int64:
-                    dr[key] = System.Int64(value)
-                elif col_type == System.Int32:
-                    dr[key] = System.Int32(value)
-                else:
-                    dr[key] = value
-            else:
-                dr[key] = value
-        dt.Rows.Add(dr)
     dt.TableName = table_name
     return dt
 
 
+def dicts_to_datatable(
+    data: list[dict], table_name: str, columns: tuple[str, ...] | None = None
+):
+    """Convert list of dicts to .NET DataTable.
+
+    columns defaults to the first dict's keys; callers that already know them can
+    pass them in.
+    """
+    _, DBNull, _, _, _ = _ensure_clr_available()
+    import System  # type: ignore[import-untyped]
+
+    if columns is None:
+        columns = tuple(data[0])
+    # Clone copies the schema only; the shared template is never written to
+    dt = _get_datatable_template(table_name, columns).Clone()
+    column_types = _get_typed_columns()
+    db_null = DBNull.Value
+
+    # Convert column by column (one type decision per column instead of per cell),
+    # then add each row with a single Rows.Add(object[]) call rather than one
+    # pythonnet call per cell
+    converted_columns = []
+    for col in columns:
+        convert = column_types.get(col)
+        if convert is None:
+            converted_columns.append(
+                [db_null if (value := row.get(col)) is None else value for row in data]
+            )
+        else:
+            converted_columns.append(
+                [
+                    db_null if (value := row.get(col)) is None else convert(value)
+                    for row in data
+                ]
+            )
+
+    object_array = System.Array[System.Object]
+    add_row = dt.Rows.Add
+    for values in zip(*converted_columns):
+        add_row(object_array(values))
+    return dt
+
+
+# Connection strings (and the host's resolved address in them) are reused for this
+# long so every batch doesn't pay a URL parse and DNS lookup, while a server that
+# moves is still picked up
+_DNS_CACHE_SECONDS = 300
+
+
 def _convert_sqlalchemy_to_dotnet_connection_string(
     sqlalchemy_url: str,
 ) -> tuple[str, object]:
@@ -134,6 +183,19 @@ def _convert_sqlalchemy_to_dotnet_connection_string(
 
     Returns: (connection_string, builder) tuple so we can access builder properties for logging
     """
+    return _build_dotnet_connection_string(
+        sqlalchemy_url, int(time.monotonic() // _DNS_CACHE_SECONDS)
+    )
+
+
+@lru_cache(maxsize=8)
+def _build_dotnet_connection_string(
+    sqlalchemy_url: str, ttl_bucket: int
+) -> tuple[str, object]:
+    """Build the .NET connection string for a URL; ttl_bucket expires the cached entry.
+
+    The returned builder is shared between callers and must not be modified.
+    """
     _, _, _, _, SqlConnectionStringBuilder = _ensure_clr_available()
 
     url = sqlalchemy_url.replace("mssql+pyodbc://", "mssql://")
@@ -165,7 +227,9 @@ def _convert_sqlalchemy_to_dotnet_connection_string(
     builder.UserID = username
     builder.Password = password
     builder["Encrypt"] = "True"
-    builder.Pooling = False
+    # Pooled: Close() hands the session back to SqlClient's pool, so later batches
+    # skip the TCP/TLS handshake and login. Broken sessions are evicted by SqlClient.
+    builder.Pooling = True
     builder.ConnectTimeout = 30
 
     if trust_cert:
@@ -188,16 +252,21 @@ def bulk_insert(
         connection_string
     )
 
-    dt = dicts_to_datatable(data_list, table_name)
+    # Every record in a batch comes from the same model, so the first one's keys
+    # give the columns for both the DataTable and the column mappings
+    columns = tuple(data_list[0])
+    dt = dicts_to_datatable(data_list, table_name, columns)
     conn = SqlConnection(dotnet_conn_string)
     try:
         conn.Open()
         bulk_copy = SqlBulkCopy(conn)
         bulk_copy.DestinationTableName = table_name
 
-        # Map columns by name to avoid position-based mapping issues
-        for col in dt.Columns:
-            bulk_copy.ColumnMappings.Add(col.ColumnName, col.ColumnName)
+        # Map columns by name to avoid position-based mapping issues. Names come
+        # from the Python side rather than enumerating dt.Columns across pythonnet.
+        add_mapping = bulk_copy.ColumnMappings.Add
+        for column in columns:
+            add_mapping(column, column)
 
         bulk_copy.WriteToServer(dt)
         logger.debug(
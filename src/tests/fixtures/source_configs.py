@@ -38,6 +38,17 @@ TEST_SALES_WITH_DLQ = CSVSource(
     validation_error_threshold=1.0,  # Allow 100% error rate to capture all errors in DLQ
 )
 
+TEST_SALES_DIRECT_UPSERT = CSVSource(
+    file_pattern="sales_*.csv",
+    source_model=TestTransaction,
+    table_name="transactions",
+    grain=["transaction_id"],
+    delimiter=",",
+    encoding="utf-8",
+    skip_rows=0,
+    direct_upsert=True,
+)
+
 
 class TestProduct(TableModel):
     sku: str = Field(alias="SKU")
@@ -8,6 +8,7 @@ from unittest.mock import patch
 import pytest
 from sqlalchemy import MetaData, Table, select
 
+from src.db import file_load_log, rehash_target_table
 from src.exceptions import MissingColumnsError, MissingHeaderError
 from src.file_processor import FileProcessor
 from src.readers.csv_reader import CSVReader
@@ -433,3 +434,112 @@ def test_csv_dead_letter_queue_deletes_records_after_reprocessing(
             assert "TXN002" in transaction_ids  # Now valid
             assert "TXN003" in transaction_ids
             assert "TXN004" in transaction_ids  # Now valid
+
+
+def test_csv_rehash_target_table_matches_loader_hash(test_csv_file, temp_sqlite_db):
+    """Test that rehashing existing target rows reproduces the loader's row hashes."""
+    with tempfile.TemporaryDirectory() as archive_dir:
+        MASTER_REGISTRY.sources = [TEST_SALES]
+
+        processor = FileProcessor()
+        results = processor.process_files_parallel(
+            [str(test_csv_file)], Path(archive_dir)
+        )
+        assert results[0]["success"] is True
+
+        transactions_table = Table(
+            "transactions", MetaData(), autoload_with=processor.engine
+        )
+        hash_query = select(
+            transactions_table.c.transaction_id, transactions_table.c.etl_row_hash
+        )
+        with processor.engine.begin() as connection:
+            loaded_hashes = dict(connection.execute(hash_query).fetchall())
+            # Simulate hashes written by an older algorithm
+            connection.execute(
+                transactions_table.update().values(etl_row_hash=b"stale")
+            )
+
+        assert rehash_target_table(processor.engine, TEST_SALES) == 2
+
+        with processor.engine.connect() as connection:
+            assert dict(connection.execute(hash_query).fetchall()) == loaded_hashes
+
+
+def test_csv_reload_merge_counts_inserts_and_updates(
+    test_csv_file, temp_sqlite_db, temp_directory
+):
+    """Test that the merge reports target inserts and updates for a re-load."""
+    with tempfile.TemporaryDirectory() as archive_dir:
+        MASTER_REGISTRY.sources = [TEST_SALES]
+
+        processor = FileProcessor()
+        archive_path_obj = Path(archive_dir)
+        results = processor.process_files_parallel(
+            [str(test_csv_file)], archive_path_obj
+        )
+        assert results[0]["success"] is True
+
+        # TXN001 changes, TXN002 is unchanged and TXN003 is new
+        reload_file = temp_directory / "sales_2024_reload.csv"
+        with open(reload_file, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(
+                [
+                    "transaction_id",
+                    "customer_id",
+                    "product_sku",
+                    "quantity",
+                    "unit_price",
+                    "total_amount",
+                    "sale_date",
+                    "sales_rep",
+                ]
+            )
+            writer.writerow(
+                [
+                    "TXN001",
+                    "CUST001",
+                    "SKU001",
+                    "4",
+                    "10.50",
+                    "42.00",
+                    "2024-01-15",
+                    "John Doe",
+                ]
+            )
+            writer.writerow(
+                [
+                    "TXN002",
+                    "CUST002",
+                    "SKU002",
+                    "1",
+                    "25.00",
+                    "25.00",
+                    "2024-01-16",
+                    "Jane Smith",
+                ]
+            )
+            writer.writerow(
+                [
+                    "TXN003",
+                    "CUST003",
+                    "SKU003",
+                    "3",
+                    "15.00",
+                    "45.00",
+                    "2024-01-17",
+                    "Bob Johnson",
+                ]
+            )
+
+        results = processor.process_files_parallel([str(reload_file)], archive_path_obj)
+        assert results[0]["success"] is True
+
+        with processor.engine.connect() as connection:
+            log_row = connection.execute(
+                select(file_load_log).where(file_load_log.c.id == results[0]["id"])
+            ).one()
+        assert log_row.records_stage_loaded == 3
+        assert log_row.target_inserts == 1
+        assert log_row.target_updates == 1
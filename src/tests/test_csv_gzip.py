@@ -4,7 +4,8 @@ import gzip
 import pytest
 
 from src.readers.csv_reader import CSVReader
-from src.tests.fixtures.source_configs import TEST_SALES
+from src.sources.registry import SourceRegistry
+from src.tests.fixtures.source_configs import TEST_INVENTORY, TEST_SALES
 
 
 @pytest.fixture
@@ -106,3 +107,12 @@ def test_csv_gzip_streaming_works(test_csv_gzip_file):
             assert record["transaction_id"] == "TXN002"
 
     assert record_count == 2
+
+
+def test_csv_gzip_file_matches_uncompressed_source_pattern():
+    """Test that a gzipped CSV resolves to the source matching its uncompressed name."""
+    registry = SourceRegistry(sources=[TEST_SALES, TEST_INVENTORY])
+
+    assert registry.find_source_for_file("sales_2024.csv.gz") is TEST_SALES
+    assert registry.find_source_for_file("sales_2024.csv") is TEST_SALES
+    assert registry.find_source_for_file("unknown_2024.csv.gz") is None
@@ -0,0 +1,311 @@
+import csv
+import tempfile
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import MetaData, Table, select
+
+from src.db import file_load_log
+from src.file_processor import FileProcessor
+from src.settings import config
+from src.sources.base import CSVSource
+from src.sources.systems.master import MASTER_REGISTRY
+from src.tests.fixtures.source_configs import (
+    TEST_SALES_DIRECT_UPSERT,
+    TestTransaction,
+)
+
+SALES_HEADER = [
+    "transaction_id",
+    "customer_id",
+    "product_sku",
+    "quantity",
+    "unit_price",
+    "total_amount",
+    "sale_date",
+    "sales_rep",
+]
+
+
+def _write_sales_csv(file_path: Path, rows: list[list[str]]) -> Path:
+    with open(file_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(SALES_HEADER)
+        writer.writerows(rows)
+    return file_path
+
+
+def _target_rows(processor: FileProcessor) -> dict[str, tuple]:
+    transactions_table = Table(
+        "transactions", MetaData(), autoload_with=processor.engine
+    )
+    with processor.engine.connect() as connection:
+        rows = connection.execute(
+            select(
+                transactions_table.c.transaction_id,
+                transactions_table.c.quantity,
+                transactions_table.c.source_filename,
+            )
+        ).fetchall()
+    return {row.transaction_id: (row.quantity, row.source_filename) for row in rows}
+
+
+def _log_row(processor: FileProcessor, log_id: int):
+    with processor.engine.connect() as connection:
+        return connection.execute(
+            select(file_load_log).where(file_load_log.c.id == log_id)
+        ).one()
+
+
+def test_direct_upsert_counts_inserts_and_updates_on_reload(
+    temp_sqlite_db, temp_directory
+):
+    """Test that a re-load upserts changed rows and counts inserts and updates."""
+    with tempfile.TemporaryDirectory() as archive_dir:
+        MASTER_REGISTRY.sources = [TEST_SALES_DIRECT_UPSERT]
+        processor = FileProcessor()
+
+        first_file = _write_sales_csv(
+            temp_directory / "sales_2024_01.csv",
+            [
+                [
+                    "TXN001",
+                    "CUST001",
+                    "SKU001",
+                    "2",
+                    "10.50",
+                    "21.00",
+                    "2024-01-15",
+                    "John Doe",
+                ],
+                [
+                    "TXN002",
+                    "CUST002",
+                    "SKU002",
+                    "1",
+                    "25.00",
+                    "25.00",
+                    "2024-01-16",
+                    "Jane Smith",
+                ],
+            ],
+        )
+        results = processor.process_files_parallel([str(first_file)], Path(archive_dir))
+        assert len(results) == 1
+        assert results[0]["success"] is True
+
+        first_log = _log_row(processor, results[0]["id"])
+        assert first_log.target_inserts == 2
+        assert first_log.target_updates == 0
+        assert first_log.records_stage_loaded == 2
+
+        # TXN001 changes, TXN002 is unchanged and TXN003 is new
+        second_file = _write_sales_csv(
+            temp_directory / "sales_2024_02.csv",
+            [
+                [
+                    "TXN001",
+                    "CUST001",
+                    "SKU001",
+                    "5",
+                    "10.50",
+                    "52.50",
+                    "2024-01-15",
+                    "John Doe",
+                ],
+                [
+                    "TXN002",
+                    "CUST002",
+                    "SKU002",
+                    "1",
+                    "25.00",
+                    "25.00",
+                    "2024-01-16",
+                    "Jane Smith",
+                ],
+                [
+                    "TXN003",
+                    "CUST003",
+                    "SKU003",
+                    "3",
+                    "15.00",
+                    "45.00",
+                    "2024-01-17",
+                    "Bob Johnson",
+                ],
+            ],
+        )
+        results = processor.process_files_parallel(
+            [str(second_file)], Path(archive_dir)
+        )
+        assert len(results) == 1
+        assert results[0]["success"] is True
+
+        second_log = _log_row(processor, results[0]["id"])
+        assert second_log.target_inserts == 1
+        assert second_log.target_updates == 1
+
+        assert _target_rows(processor) == {
+            "TXN001": (5, "sales_2024_02.csv"),
+            "TXN002": (1, "sales_2024_01.csv"),
+            "TXN003": (3, "sales_2024_02.csv"),
+        }
+
+
+def test_direct_upsert_last_duplicate_grain_row_wins(temp_sqlite_db, temp_directory):
+    """Test that repeated grain values in and across batches keep the last row."""
+    original_batch_size = config.BATCH_SIZE
+    try:
+        # Two rows per batch: TXN001 repeats inside the first batch and again in the second
+        config.BATCH_SIZE = 2
+        with tempfile.TemporaryDirectory() as archive_dir:
+            MASTER_REGISTRY.sources = [TEST_SALES_DIRECT_UPSERT]
+            processor = FileProcessor()
+
+            file_path = _write_sales_csv(
+                temp_directory / "sales_duplicates.csv",
+                [
+                    [
+                        "TXN001",
+                        "CUST001",
+                        "SKU001",
+                        "1",
+                        "10.00",
+                        "10.00",
+                        "2024-01-15",
+                        "John Doe",
+                    ],
+                    [
+                        "TXN001",
+                        "CUST001",
+                        "SKU001",
+                        "2",
+                        "10.00",
+                        "20.00",
+                        "2024-01-15",
+                        "John Doe",
+                    ],
+                    [
+                        "TXN002",
+                        "CUST002",
+                        "SKU002",
+                        "1",
+                        "25.00",
+                        "25.00",
+                        "2024-01-16",
+                        "Jane Smith",
+                    ],
+                    [
+                        "TXN001",
+                        "CUST001",
+                        "SKU001",
+                        "3",
+                        "10.00",
+                        "30.00",
+                        "2024-01-15",
+                        "John Doe",
+                    ],
+                ],
+            )
+            results = processor.process_files_parallel(
+                [str(file_path)], Path(archive_dir)
+            )
+            assert len(results) == 1
+            assert results[0]["success"] is True
+
+            assert _target_rows(processor) == {
+                "TXN001": (3, "sales_duplicates.csv"),
+                "TXN002": (1, "sales_duplicates.csv"),
+            }
+    finally:
+        config.BATCH_SIZE = original_batch_size
+
+
+def test_direct_upsert_threshold_exceeded_loads_nothing(temp_sqlite_db, temp_directory):
+    """Test that a file over its validation threshold is rolled back entirely."""
+    original_batch_size = config.BATCH_SIZE
+    try:
+        # Valid rows are upserted over several batches before the bad row is read
+        config.BATCH_SIZE = 1
+        with tempfile.TemporaryDirectory() as archive_dir:
+            MASTER_REGISTRY.sources = [TEST_SALES_DIRECT_UPSERT]
+            processor = FileProcessor()
+
+            file_path = _write_sales_csv(
+                temp_directory / "sales_threshold.csv",
+                [
+                    [
+                        "TXN001",
+                        "CUST001",
+                        "SKU001",
+                        "2",
+                        "10.50",
+                        "21.00",
+                        "2024-01-15",
+                        "John Doe",
+                    ],
+                    [
+                        "TXN002",
+                        "CUST002",
+                        "SKU002",
+                        "1",
+                        "25.00",
+                        "25.00",
+                        "2024-01-16",
+                        "Jane Smith",
+                    ],
+                    [
+                        "TXN003",
+                        "CUST003",
+                        "SKU003",
+                        "not_a_number",
+                        "15.00",
+                        "45.00",
+                        "2024-01-17",
+                        "Bob Johnson",
+                    ],
+                ],
+            )
+            results = processor.process_files_parallel(
+                [str(file_path)], Path(archive_dir)
+            )
+            assert len(results) == 1
+            assert results[0]["success"] is False
+            assert results[0]["error_type"] == "Validation Threshold Exceeded"
+
+            assert _target_rows(processor) == {}
+            with processor.engine.connect() as connection:
+                dlq_table = processor._get_file_load_dlq()
+                dlq_records = connection.execute(
+                    select(dlq_table).where(
+                        dlq_table.c.source_filename == "sales_threshold.csv"
+                    )
+                ).fetchall()
+            assert dlq_records == []
+
+            # Nothing was published, so the file is not treated as a duplicate
+            assert not processor._check_duplicate_file(
+                TEST_SALES_DIRECT_UPSERT, "sales_threshold.csv"
+            )
+
+            log = _log_row(processor, results[0]["id"])
+            assert log.success is False
+            assert log.validation_errors == 1
+    finally:
+        config.BATCH_SIZE = original_batch_size
+
+
+def test_direct_upsert_cannot_use_audit_query():
+    """Test that direct_upsert sources reject an audit_query."""
+    with pytest.raises(ValidationError) as exc_info:
+        CSVSource(
+            file_pattern="sales_*.csv",
+            source_model=TestTransaction,
+            table_name="transactions",
+            grain=["transaction_id"],
+            audit_query="SELECT 1 AS always_passes FROM {table}",
+            direct_upsert=True,
+        )
+
+    assert "cannot use an audit_query" in str(exc_info.value)
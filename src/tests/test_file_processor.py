@@ -0,0 +1,275 @@
+import csv
+import logging
+import tempfile
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import MetaData, Table, func, inspect, select, text
+
+import src.file_processor as file_processor_module
+from src.db import file_load_log
+from src.file_processor import FileProcessor, _process_file_in_worker
+from src.notifications import _enqueue_slack_message, _flush_slack_notifications
+from src.settings import config
+from src.sources.systems.master import MASTER_REGISTRY
+from src.tests.fixtures.source_configs import TEST_SALES
+
+SALES_HEADER = [
+    "transaction_id",
+    "customer_id",
+    "product_sku",
+    "quantity",
+    "unit_price",
+    "total_amount",
+    "sale_date",
+    "sales_rep",
+]
+
+
+def _write_sales_csv(file_path: Path, transaction_ids: list[str]) -> Path:
+    with open(file_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(SALES_HEADER)
+        for transaction_id in transaction_ids:
+            writer.writerow(
+                [
+                    transaction_id,
+                    "CUST001",
+                    "SKU001",
+                    "1",
+                    "10.00",
+                    "10.00",
+                    "2024-01-15",
+                    "John Doe",
+                ]
+            )
+    return file_path
+
+
+def _count_target_rows(processor: FileProcessor) -> int:
+    transactions_table = Table(
+        "transactions", MetaData(), autoload_with=processor.engine
+    )
+    with processor.engine.connect() as connection:
+        return connection.execute(
+            select(func.count()).select_from(transactions_table)
+        ).scalar()
+
+
+def test_process_pool_loads_files_in_worker_processes(
+    temp_sqlite_db, temp_directory, monkeypatch
+):
+    """Test that PROCESS_POOL_FLAG runs load every file and clean up stage tables."""
+    # Spawned workers build their own config, so they find the test database here
+    monkeypatch.setenv("TEST_DATABASE_URL", config.DATABASE_URL)
+    monkeypatch.setattr(config, "PROCESS_POOL_FLAG", True)
+    MASTER_REGISTRY.sources = [TEST_SALES]
+
+    file_paths = [
+        str(_write_sales_csv(temp_directory / "sales_pool_1.csv", ["TXN001"])),
+        str(_write_sales_csv(temp_directory / "sales_pool_2.csv", ["TXN002"])),
+    ]
+
+    with tempfile.TemporaryDirectory() as archive_dir:
+        processor = FileProcessor()
+        results = processor.process_files_parallel(file_paths, Path(archive_dir))
+
+    assert sorted(r["source_filename"] for r in results) == [
+        "sales_pool_1.csv",
+        "sales_pool_2.csv",
+    ]
+    assert all(r["success"] is True for r in results)
+    assert _count_target_rows(processor) == 2
+    assert not [
+        name
+        for name in inspect(processor.engine).get_table_names()
+        if name.startswith("stage_")
+    ]
+
+
+def test_process_pool_worker_flushes_slack_notifications(temp_sqlite_db):
+    """Test that a pool worker sends queued Slack messages before returning."""
+    webhook = MagicMock()
+
+    def slow_send(text):
+        time.sleep(0.2)
+        return MagicMock(status_code=200)
+
+    webhook.send.side_effect = slow_send
+
+    def process_single_file(self, file_path_str, archive_path):
+        _enqueue_slack_message("https://hooks.example.com/test", "worker alert")
+        return None
+
+    with (
+        patch("src.notifications.WebhookClient", return_value=webhook),
+        patch.object(FileProcessor, "_process_single_file", process_single_file),
+    ):
+        try:
+            result, _ = _process_file_in_worker("sales_2024.csv", Path("."))
+
+            assert result is None
+            webhook.send.assert_called_once_with(text="worker alert")
+        finally:
+            _flush_slack_notifications()
+            file_processor_module._worker_processor = None
+
+
+def test_log_row_reflects_final_state_after_run(test_csv_file, temp_sqlite_db):
+    """Test that the background log writer has written the final log row by the end of the run."""
+    MASTER_REGISTRY.sources = [TEST_SALES]
+
+    with tempfile.TemporaryDirectory() as archive_dir:
+        processor = FileProcessor()
+        results = processor.process_files_parallel(
+            [str(test_csv_file)], Path(archive_dir)
+        )
+
+    assert results[0]["success"] is True
+    with processor.engine.connect() as connection:
+        log_row = connection.execute(
+            select(file_load_log).where(file_load_log.c.id == results[0]["id"])
+        ).one()
+    assert log_row.success is True
+    assert log_row.ended_at is not None
+    assert log_row.processing_success is True
+    assert log_row.stage_load_success is True
+    assert log_row.merge_success is True
+    assert log_row.records_processed == 2
+    assert log_row.target_inserts == 2
+
+
+def test_log_write_failure_raised_at_flush(test_csv_file, temp_sqlite_db):
+    """Test that a log update that cannot be written fails the run instead of going stale."""
+    MASTER_REGISTRY.sources = [TEST_SALES]
+
+    with tempfile.TemporaryDirectory() as archive_dir:
+        processor = FileProcessor()
+        with patch(
+            "src.file_processor._write_log_updates",
+            side_effect=Exception("database unavailable"),
+        ):
+            with pytest.raises(RuntimeError) as exc_info:
+                processor.process_files_parallel(
+                    [str(test_csv_file)], Path(archive_dir)
+                )
+
+    assert "Failed to write file load log updates" in str(exc_info.value)
+    assert "database unavailable" in str(exc_info.value.__cause__)
+
+
+def test_fail_fast_cancels_files_not_yet_started(
+    csv_missing_header, temp_sqlite_db, temp_directory, monkeypatch
+):
+    """Test that fail_fast stops pending files after the first failure."""
+    # One worker, so files start in submission order and the failing file runs first
+    monkeypatch.setattr(config, "IO_CONCURRENCY", 1)
+    MASTER_REGISTRY.sources = [TEST_SALES]
+
+    valid_files = [
+        _write_sales_csv(temp_directory / f"sales_valid_{i}.csv", [f"TXN00{i}"])
+        for i in range(1, 4)
+    ]
+
+    # The worker may pick up the next file before the failure is seen; hold such a
+    # file until the pending ones have been cancelled
+    fail_fast_logged = threading.Event()
+
+    class FailFastHandler(logging.Handler):
+        def emit(self, record):
+            if record.getMessage().startswith("Fail fast"):
+                fail_fast_logged.set()
+
+    started = []
+    original_process_single_file = FileProcessor._process_single_file
+
+    def process_single_file(self, file_path_str, archive_path):
+        if file_path_str != str(csv_missing_header):
+            fail_fast_logged.wait(timeout=5)
+        started.append(Path(file_path_str).name)
+        return original_process_single_file(self, file_path_str, archive_path)
+
+    monkeypatch.setattr(FileProcessor, "_process_single_file", process_single_file)
+    handler = FailFastHandler()
+    logging.getLogger("src.file_processor").addHandler(handler)
+    try:
+        with tempfile.TemporaryDirectory() as archive_dir:
+            processor = FileProcessor()
+            results = processor.process_files_parallel(
+                [str(csv_missing_header)] + [str(path) for path in valid_files],
+                Path(archive_dir),
+                fail_fast=True,
+            )
+    finally:
+        logging.getLogger("src.file_processor").removeHandler(handler)
+
+    assert fail_fast_logged.is_set()
+    assert started[0] == csv_missing_header.name
+    # At most the file already picked up by the worker ran after the failure
+    assert started[1:] in ([], [valid_files[0].name])
+    assert [r["source_filename"] for r in results] == started
+    assert results[0]["success"] is False
+    assert results[0]["error_type"] == "Missing Header"
+    # Cancelled files are left in place for the next run
+    for path in valid_files[1:]:
+        assert path.exists()
+    assert _count_target_rows(processor) == len(started) - 1
+
+
+def test_stage_table_reused_across_files_and_dropped_after_run(
+    temp_sqlite_db, temp_directory, monkeypatch
+):
+    """Test that one worker reuses its stage table per source and drops it at the end."""
+    # One worker, so both files share the same (source, worker) stage table
+    monkeypatch.setattr(config, "IO_CONCURRENCY", 1)
+    MASTER_REGISTRY.sources = [TEST_SALES]
+
+    first_file = _write_sales_csv(
+        temp_directory / "sales_stage_1.csv", ["TXN001", "TXN002"]
+    )
+    second_file = _write_sales_csv(temp_directory / "sales_stage_2.csv", ["TXN003"])
+
+    staged = []
+    original_merge = FileProcessor._merge_stage_to_target
+
+    def merge_stage_to_target(self, stage_table_name, *args, **kwargs):
+        with self.engine.connect() as connection:
+            staged.append(
+                (
+                    stage_table_name,
+                    connection.execute(
+                        text(f"SELECT COUNT(*) FROM {stage_table_name}")
+                    ).scalar(),
+                )
+            )
+        return original_merge(self, stage_table_name, *args, **kwargs)
+
+    monkeypatch.setattr(FileProcessor, "_merge_stage_to_target", merge_stage_to_target)
+
+    with (
+        tempfile.TemporaryDirectory() as archive_dir,
+        patch(
+            "src.file_processor.create_stage_table",
+            wraps=file_processor_module.create_stage_table,
+        ) as create_stage_table,
+    ):
+        processor = FileProcessor()
+        results = processor.process_files_parallel(
+            [str(first_file), str(second_file)], Path(archive_dir)
+        )
+
+    assert [r["success"] for r in results] == [True, True]
+    assert create_stage_table.call_count == 1
+    # Same table both times, truncated between files: only the second file's row
+    assert len({stage_table_name for stage_table_name, _ in staged}) == 1
+    assert [row_count for _, row_count in staged] == [2, 1]
+    assert _count_target_rows(processor) == 3
+    assert not [
+        name
+        for name in inspect(processor.engine).get_table_names()
+        if name.startswith("stage_")
+    ]
+    assert processor._stage_tables == {}
@@ -0,0 +1,31 @@
+from pathlib import Path
+
+from src.process import _discover_files
+from src.settings import config
+
+
+def _touch(path: Path) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("")
+    return path
+
+
+def test_recursive_discovery_skips_hidden_archive_and_duplicate_directories(
+    temp_directory, monkeypatch
+):
+    """Test that recursive discovery walks subdirectories except hidden, archive and duplicate ones."""
+    monkeypatch.setattr(config, "ARCHIVE_PATH", temp_directory / "archive")
+    monkeypatch.setattr(config, "DUPLICATE_FILES_PATH", temp_directory / "duplicates")
+
+    top_level = _touch(temp_directory / "sales_2024.csv")
+    nested = _touch(temp_directory / "region" / "east" / "ledger_2024.json")
+    _touch(temp_directory / "region" / "notes.txt")
+    _touch(temp_directory / "region" / ".sales_hidden.csv")
+    _touch(temp_directory / ".hidden" / "sales_hidden.csv")
+    _touch(temp_directory / "archive" / "sales_archived.csv")
+    _touch(temp_directory / "duplicates" / "sales_duplicate.csv")
+
+    assert sorted(_discover_files(str(temp_directory), recursive=True)) == sorted(
+        [str(top_level), str(nested)]
+    )
+    assert _discover_files(str(temp_directory), recursive=False) == [str(top_level)]
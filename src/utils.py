@@ -1,16 +1,22 @@
+import errno
 import logging
+import os
+from functools import cache
+from pathlib import Path
 from typing import Dict
 
+from pydantic import BaseModel
+
 from src.readers.base_reader import BaseReader
 from src.sources.base import DataSource
 
 logger = logging.getLogger(__name__)
 
 
-def create_field_mapping(reader: BaseReader) -> Dict[str, str]:
-    """Create a mapping from field aliases/lowercase names to actual field names."""
+@cache
+def _model_field_mapping(model: type[BaseModel]) -> Dict[str, str]:
     field_mapping = {}
-    for field_name, field_info in reader.source.source_model.model_fields.items():
+    for field_name, field_info in model.model_fields.items():
         if field_info.alias:
             field_mapping[field_info.alias.lower()] = field_name
         else:
@@ -18,9 +24,10 @@ def create_field_mapping(reader: BaseReader) -> Dict[str, str]:
     return field_mapping
 
 
-def create_reverse_field_mapping(reader: BaseReader) -> Dict[str, str]:
+@cache
+def _model_reverse_field_mapping(model: type[BaseModel]) -> Dict[str, str]:
     reverse_mapping = {}
-    for field_name, field_info in reader.source.source_model.model_fields.items():
+    for field_name, field_info in model.model_fields.items():
         if field_info.alias:
             reverse_mapping[field_name] = field_info.alias
         else:
@@ -28,6 +35,34 @@ def create_reverse_field_mapping(reader: BaseReader) -> Dict[str, str]:
     return reverse_mapping
 
 
+def create_field_mapping(reader: BaseReader) -> Dict[str, str]:
+    """Create a mapping from field aliases/lowercase names to actual field names.
+
+    The mapping is built once per model and shared; callers must not mutate it.
+    """
+    return _model_field_mapping(reader.source.source_model)
+
+
+def create_reverse_field_mapping(reader: BaseReader) -> Dict[str, str]:
+    return _model_reverse_field_mapping(reader.source.source_model)
+
+
+class FieldNameResolver(dict):
+    """Maps raw file keys to model field names (None for unneeded columns).
+
+    Each distinct raw key is lowercased and looked up once per file; after that
+    resolving a key is a single dict lookup.
+    """
+
+    def __init__(self, field_mapping: Dict[str, str]):
+        super().__init__()
+        self._field_mapping = field_mapping
+
+    def __missing__(self, key: str) -> str | None:
+        field_name = self[key] = self._field_mapping.get(key.lower())
+        return field_name
+
+
 def get_field_alias(source: DataSource, field_name: str) -> str:
     """Get the file column name (alias) for a field name.
 
@@ -128,3 +163,80 @@ def extract_validation_error_message(
         return "[{}]"
     else:
         return f"[{{error_msg: {str(validation_error).lower()}}}]"
+
+
+_COPY_BUFFER_SIZE = 1024 * 1024
+# Errors meaning "this copy mechanism is unavailable here", not a real I/O failure
+_COPY_FALLBACK_ERRNOS = {
+    errno.ENOSYS,
+    errno.EXDEV,
+    errno.EINVAL,
+    errno.EOPNOTSUPP,
+    errno.ENOTSUP,
+}
+
+
+def fast_copy(source_path: Path, destination_path: Path) -> None:
+    """Copy a file kernel-side where possible.
+
+    Tries os.copy_file_range (no userspace buffer; reflinks or server-side copies
+    on filesystems that support them), then os.sendfile, then a 1 MiB readinto loop.
+    """
+    in_fd = os.open(source_path, os.O_RDONLY)
+    try:
+        out_fd = os.open(destination_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            size = os.fstat(in_fd).st_size
+            for copy_chunk in (_copy_file_range_chunk, _sendfile_chunk):
+                if _copy_with(copy_chunk, in_fd, out_fd, size) is not None:
+                    return
+                # Nothing usable was written; restart from the beginning with the next method
+                os.lseek(in_fd, 0, os.SEEK_SET)
+                os.lseek(out_fd, 0, os.SEEK_SET)
+                os.ftruncate(out_fd, 0)
+            _readinto_copy(in_fd, out_fd)
+        finally:
+            os.close(out_fd)
+    finally:
+        os.close(in_fd)
+
+
+def _copy_file_range_chunk(in_fd: int, out_fd: int, count: int) -> int:
+    if not hasattr(os, "copy_file_range"):
+        raise OSError(errno.ENOSYS, "copy_file_range is not available")
+    return os.copy_file_range(in_fd, out_fd, count)
+
+
+def _sendfile_chunk(in_fd: int, out_fd: int, count: int) -> int:
+    if not hasattr(os, "sendfile"):
+        raise OSError(errno.ENOSYS, "sendfile is not available")
+    return os.sendfile(out_fd, in_fd, None, count)
+
+
+def _copy_with(copy_chunk, in_fd: int, out_fd: int, size: int) -> int | None:
+    """Copy until EOF with copy_chunk; None if the mechanism is unusable for this file."""
+    copied = 0
+    while True:
+        try:
+            sent = copy_chunk(in_fd, out_fd, max(size - copied, _COPY_BUFFER_SIZE))
+        except OSError as e:
+            # Only fall back when nothing has been written yet
+            if copied == 0 and e.errno in _COPY_FALLBACK_ERRNOS:
+                return None
+            raise
+        if sent == 0:
+            # Some virtual files (e.g. procfs) report 0 on the first call despite content
+            if copied == 0 and size > 0:
+                return None
+            return copied
+        copied += sent
+
+
+def _readinto_copy(in_fd: int, out_fd: int) -> None:
+    buffer = bytearray(_COPY_BUFFER_SIZE)
+    view = memoryview(buffer)
+    with open(in_fd, "rb", buffering=0, closefd=False) as source:
+        while read := source.readinto(buffer):
+            written = 0
+            while written < read:
+                written += os.write(out_fd, view[written:read])